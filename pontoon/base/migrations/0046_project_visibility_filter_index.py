@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0045_drop_project_links_url_width"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["disabled", "system_project", "visibility"],
+                name="project_visibility_filter_idx",
+            ),
+        ),
+    ]
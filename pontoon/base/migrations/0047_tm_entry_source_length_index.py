@@ -0,0 +1,18 @@
+from django.db import migrations, models
+from django.db.models.functions import Length
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0046_project_visibility_filter_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="translationmemoryentry",
+            index=models.Index(
+                Length("source"), name="tm_entry_source_length_idx"
+            ),
+        ),
+    ]
@@ -1,18 +1,15 @@
 import hashlib
-import json
 import logging
 import math
 import operator
 import os.path
 import re
-import requests
 
-import Levenshtein
-
-from collections import defaultdict
 from dirtyfields import DirtyFieldsMixin
-from django.db.models.functions import Length, Substr, Cast
-from functools import reduce
+from itertools import groupby
+from django.db.models.functions import Coalesce, Length, Substr, Cast
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from functools import lru_cache, reduce
 from urllib.parse import quote, urlencode, urlparse
 
 from django.conf import settings
@@ -21,10 +18,13 @@ from django.contrib.postgres.fields import ArrayField
 
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
-from django.db import models
+from django.db import connection, models, transaction
 from django.db.models import (
     Count,
+    Exists,
     F,
+    Max,
+    OuterRef,
     Prefetch,
     Q,
     Sum,
@@ -33,20 +33,26 @@ from django.db.models import (
     Value,
     ExpressionWrapper,
 )
+from django.db.models.expressions import RawSQL
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
 
 from guardian.shortcuts import get_objects_for_user
 from jsonfield import JSONField
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 
 from pontoon.actionlog.models import ActionLog
-from pontoon.actionlog.utils import log_action
 from pontoon.base import utils
 from pontoon.base.fluent import get_simple_preview
 from pontoon.checks import DB_FORMATS
 from pontoon.checks.utils import save_failed_checks
-from pontoon.db import IContainsCollate, LevenshteinDistance  # noqa
+from pontoon.db import (  # noqa
+    IContainsCollate,
+    LevenshteinDistance,
+    LevenshteinDistanceLessEqual,
+)
 from pontoon.sync import KEY_SEPARATOR
 
 log = logging.getLogger(__name__)
@@ -80,9 +86,13 @@ def combine_entity_filters(entities, filter_choices, filters, *args):
     return reduce(operator.ior, filters)
 
 
+WORD_COUNT_RE = re.compile(r"[\w,.-]+")
+TIME_RANGE_RE = re.compile(r"^[0-9]{12}-[0-9]{12}$")
+
+
 def get_word_count(string):
     """Compute the number of words in a given string."""
-    return len(re.findall(r"[\w,.-]+", string))
+    return len(WORD_COUNT_RE.findall(string))
 
 
 @property
@@ -92,12 +102,25 @@ def user_profile_url(self):
     )
 
 
-def user_gravatar_url(self, size):
-    email = hashlib.md5(self.email.lower().encode("utf-8")).hexdigest()
+@property
+def user_email_md5(self):
+    """MD5 hexdigest of the user email, hashed at most once per instance."""
+    if not hasattr(self, "_email_md5"):
+        self._email_md5 = hashlib.md5(self.email.lower().encode("utf-8")).hexdigest()
+    return self._email_md5
+
+
+@lru_cache(maxsize=1024)
+def _gravatar_url(email_md5, display_name, size):
+    """
+    The URL is a pure function of its inputs, so cache it across user
+    instances: serializing e.g. a comment thread builds the same URL
+    once per author instead of once per comment.
+    """
     data = {
         "s": str(size),
         "d": "https://ui-avatars.com/api/{name}/{size}/{background}/{color}".format(
-            name=quote(self.display_name),
+            name=quote(display_name),
             size=size,
             background="333941",
             color="FFFFFF",
@@ -105,10 +128,14 @@ def user_gravatar_url(self, size):
     }
 
     return "//www.gravatar.com/avatar/{email}?{data}".format(
-        email=email, data=urlencode(data)
+        email=email_md5, data=urlencode(data)
     )
 
 
+def user_gravatar_url(self, size):
+    return _gravatar_url(self.email_md5, self.display_name, size)
+
+
 @property
 def user_gravatar_url_small(self):
     return user_gravatar_url(self, 88)
@@ -116,7 +143,9 @@ def user_gravatar_url_small(self):
 
 @property
 def user_name_or_email(self):
-    return self.first_name or self.email
+    if not hasattr(self, "_name_or_email"):
+        self._name_or_email = self.first_name or self.email
+    return self._name_or_email
 
 
 @property
@@ -126,7 +155,9 @@ def user_contact_email(self):
 
 @property
 def user_display_name(self):
-    return self.first_name or self.email.split("@")[0]
+    if not hasattr(self, "_display_name"):
+        self._display_name = self.first_name or self.email.split("@")[0]
+    return self._display_name
 
 
 @property
@@ -147,14 +178,11 @@ def user_translator_for_locales(self):
 
     Only includes explicitly assigned locales for superusers.
     """
-    locales = []
-
-    for group in self.groups.all():
-        locale = group.translated_locales.first()
-        if locale:
-            locales.append(locale)
-
-    return locales
+    return list(
+        Locale.objects.filter(translators_group__in=self.groups.all()).only(
+            "code", "name"
+        )
+    )
 
 
 @property
@@ -163,14 +191,11 @@ def user_manager_for_locales(self):
 
     Only includes explicitly assigned locales for superusers.
     """
-    locales = []
-
-    for group in self.groups.all():
-        locale = group.managed_locales.first()
-        if locale:
-            locales.append(locale)
-
-    return locales
+    return list(
+        Locale.objects.filter(managers_group__in=self.groups.all()).only(
+            "code", "name"
+        )
+    )
 
 
 @property
@@ -202,15 +227,17 @@ def user_translated_projects(self):
     :param self:
     :return:
     """
-    user_project_locales = (
+    user_project_locales = frozenset(
         get_objects_for_user(
             self, "base.can_translate_project_locale", accept_global_perms=False
-        )
-    ).values_list("pk", flat=True)
+        ).values_list("pk", flat=True)
+    )
 
-    project_locales = ProjectLocale.objects.filter(
-        has_custom_translators=True
-    ).values_list("pk", "locale__code", "project__slug")
+    project_locales = (
+        ProjectLocale.objects.filter(has_custom_translators=True)
+        .values_list("pk", "locale__code", "project__slug")
+        .iterator()
+    )
     permission_map = {
         f"{locale}-{project}": (pk in user_project_locales)
         for pk, locale, project in project_locales
@@ -233,19 +260,25 @@ def user_role(self, managers=None, translators=None):
         if self in managers:
             return "Manager for " + ", ".join(managers[self])
     else:
-        if self.managed_locales:
-            return "Manager for " + ", ".join(
-                self.managed_locales.values_list("code", flat=True)
+        managed_codes = list(
+            Locale.objects.filter(managers_group__user=self).values_list(
+                "code", flat=True
             )
+        )
+        if managed_codes:
+            return "Manager for " + ", ".join(managed_codes)
 
     if translators is not None:
         if self in translators:
             return "Translator for " + ", ".join(translators[self])
     else:
-        if self.translated_locales:
-            return "Translator for " + ", ".join(
-                self.translated_locales.values_list("code", flat=True)
+        translated_codes = list(
+            Locale.objects.filter(translators_group__user=self).values_list(
+                "code", flat=True
             )
+        )
+        if translated_codes:
+            return "Translator for " + ", ".join(translated_codes)
 
     return "Contributor"
 
@@ -255,9 +288,9 @@ def user_locale_role(self, locale):
         return "Admin"
     if self.pk is None or self.profile.system_user:
         return "System User"
-    if self in locale.managers_group.user_set.all():
+    if locale.managers_group.user_set.filter(pk=self.pk).exists():
         return "Manager"
-    if self in locale.translators_group.user_set.all():
+    if locale.translators_group.user_set.filter(pk=self.pk).exists():
         return "Translator"
     else:
         return "Contributor"
@@ -272,29 +305,35 @@ def contributed_translations(self):
 @property
 def top_contributed_locale(self):
     """Locale the user has made the most contributions to."""
-    try:
-        return (
-            self.translation_set.values("locale__code")
-            .annotate(total=Count("locale__code"))
-            .distinct()
-            .order_by("-total")
-            .first()["locale__code"]
-        )
-    except TypeError:
-        # This error is raised if `top_contribution` is null. That happens if the user
-        # has never contributed to any locales.
-        return None
+    top_contribution = (
+        self.translation_set.values("locale__code")
+        .annotate(total=Count("pk"))
+        .order_by("-total")
+        .first()
+    )
+
+    # `top_contribution` is None if the user has never contributed to any locales.
+    return top_contribution["locale__code"] if top_contribution else None
 
 
 def can_translate(self, locale, project):
     """Check if user has suitable permissions to translate in given locale or project/locale."""
 
-    # Locale managers can translate all projects
-    if locale in self.managed_locales:
+    # Locale managers can translate all projects. Cache the managed locale
+    # pks on the instance, as this method runs on hot translate endpoints.
+    if not hasattr(self, "_managed_locales_pks"):
+        self._managed_locales_pks = set(
+            self.managed_locales.values_list("pk", flat=True)
+        )
+    if locale.pk in self._managed_locales_pks:
         return True
 
-    project_locale = ProjectLocale.objects.get(project=project, locale=locale)
-    if project_locale.has_custom_translators:
+    project_locale = (
+        ProjectLocale.objects.filter(project=project, locale=locale)
+        .only("pk", "has_custom_translators")
+        .first()
+    )
+    if project_locale and project_locale.has_custom_translators:
         return self.has_perm("base.can_translate_project_locale", project_locale)
 
     return self.has_perm("base.can_translate_locale", locale)
@@ -302,17 +341,24 @@ def can_translate(self, locale, project):
 
 def is_new_contributor(self, locale):
     """Return True if the user hasn't made contributions to the locale yet."""
-    return (
-        not self.translation_set.filter(locale=locale)
-        .exclude(entity__resource__project__system_project=True)
-        .exists()
-    )
+    return not self.translation_set.filter(
+        locale=locale,
+        entity__resource__project__system_project=False,
+    ).exists()
+
+
+@property
+def unread_notifications_count(self):
+    """Number of unread notifications, counted at most once per instance."""
+    if not hasattr(self, "_unread_notifications_count"):
+        self._unread_notifications_count = self.notifications.unread().count()
+    return self._unread_notifications_count
 
 
 @property
 def menu_notifications(self):
     """A list of notifications to display in the notifications menu."""
-    unread_count = self.notifications.unread().count()
+    unread_count = self.unread_notifications_count
     count = settings.NOTIFICATIONS_MAX_COUNT
 
     if unread_count > count:
@@ -326,7 +372,7 @@ def menu_notifications(self):
 @property
 def unread_notifications_display(self):
     """Textual representation of the unread notifications count."""
-    count = self.notifications.unread().count()
+    count = self.unread_notifications_count
 
     if count > 9:
         return "9+"
@@ -337,16 +383,30 @@ def unread_notifications_display(self):
 @property
 def serialized_notifications(self):
     """Serialized list of notifications to display in the notifications menu."""
-    unread_count = self.notifications.unread().count()
+    unread_count = self.unread_notifications_count
     count = settings.NOTIFICATIONS_MAX_COUNT
     notifications = []
 
     if unread_count > count:
         count = unread_count
 
-    for notification in self.notifications.prefetch_related(
-        "actor", "target", "action_object"
-    )[:count]:
+    notifications_qs = list(
+        self.notifications.prefetch_related("actor", "target", "action_object")[:count]
+    )
+
+    # Comment notifications target an Entity and render its resource and
+    # project, which the generic prefetch above cannot join. Bulk-load them
+    # in a single query instead of two queries per notification.
+    entity_pks = [n.target.pk for n in notifications_qs if isinstance(n.target, Entity)]
+    if entity_pks:
+        entities = Entity.objects.filter(pk__in=entity_pks).select_related(
+            "resource__project"
+        ).in_bulk()
+        for n in notifications_qs:
+            if isinstance(n.target, Entity):
+                n.target = entities[n.target.pk]
+
+    for notification in notifications_qs:
         actor = None
         is_comment = False
 
@@ -458,6 +518,7 @@ def latest_action(self):
 
 
 User.add_to_class("profile_url", user_profile_url)
+User.add_to_class("email_md5", user_email_md5)
 User.add_to_class("gravatar_url", user_gravatar_url)
 User.add_to_class("gravatar_url_small", user_gravatar_url_small)
 User.add_to_class("name_or_email", user_name_or_email)
@@ -476,6 +537,7 @@ User.add_to_class("contributed_translations", contributed_translations)
 User.add_to_class("top_contributed_locale", top_contributed_locale)
 User.add_to_class("can_translate", can_translate)
 User.add_to_class("is_new_contributor", is_new_contributor)
+User.add_to_class("unread_notifications_count", unread_notifications_count)
 User.add_to_class("menu_notifications", menu_notifications)
 User.add_to_class("unread_notifications_display", unread_notifications_display)
 User.add_to_class("serialized_notifications", serialized_notifications)
@@ -536,25 +598,26 @@ class AggregatedStats(models.Model):
         """
         Get sum of stats for all items in the queryset.
         """
-        return {
-            "total_strings": sum(x.total_strings for x in qs),
-            "approved_strings": sum(x.approved_strings for x in qs),
-            "pretranslated_strings": sum(x.pretranslated_strings for x in qs),
-            "strings_with_errors": sum(x.strings_with_errors for x in qs),
-            "strings_with_warnings": sum(x.strings_with_warnings for x in qs),
-            "unreviewed_strings": sum(x.unreviewed_strings for x in qs),
-        }
+        return qs.aggregate(
+            total_strings=Coalesce(Sum("total_strings"), 0),
+            approved_strings=Coalesce(Sum("approved_strings"), 0),
+            pretranslated_strings=Coalesce(Sum("pretranslated_strings"), 0),
+            strings_with_errors=Coalesce(Sum("strings_with_errors"), 0),
+            strings_with_warnings=Coalesce(Sum("strings_with_warnings"), 0),
+            unreviewed_strings=Coalesce(Sum("unreviewed_strings"), 0),
+        )
 
     @classmethod
     def get_top_instances(cls, qs):
         """
         Get top instances in the queryset.
         """
+        annotated = qs.with_missing_strings()
         return {
-            "most_strings": sorted(qs, key=lambda x: x.total_strings)[-1],
-            "most_translations": sorted(qs, key=lambda x: x.approved_strings)[-1],
-            "most_suggestions": sorted(qs, key=lambda x: x.unreviewed_strings)[-1],
-            "most_missing": sorted(qs, key=lambda x: x.missing_strings)[-1],
+            "most_strings": annotated.order_by("-total_strings").first(),
+            "most_translations": annotated.order_by("-approved_strings").first(),
+            "most_suggestions": annotated.order_by("-unreviewed_strings").first(),
+            "most_missing": annotated.order_by("-missing").first(),
         }
 
     def adjust_stats(
@@ -566,26 +629,56 @@ class AggregatedStats(models.Model):
         strings_with_warnings_diff,
         unreviewed_strings_diff,
     ):
-        self.total_strings = F("total_strings") + total_strings_diff
-        self.approved_strings = F("approved_strings") + approved_strings_diff
-        self.pretranslated_strings = (
-            F("pretranslated_strings") + pretranslated_strings_diff
-        )
-        self.strings_with_errors = F("strings_with_errors") + strings_with_errors_diff
-        self.strings_with_warnings = (
-            F("strings_with_warnings") + strings_with_warnings_diff
-        )
-        self.unreviewed_strings = F("unreviewed_strings") + unreviewed_strings_diff
+        diffs = {
+            "total_strings": total_strings_diff,
+            "approved_strings": approved_strings_diff,
+            "pretranslated_strings": pretranslated_strings_diff,
+            "strings_with_errors": strings_with_errors_diff,
+            "strings_with_warnings": strings_with_warnings_diff,
+            "unreviewed_strings": unreviewed_strings_diff,
+        }
 
-        self.save(
-            update_fields=[
-                "total_strings",
-                "approved_strings",
-                "pretranslated_strings",
-                "strings_with_errors",
-                "strings_with_warnings",
-                "unreviewed_strings",
-            ]
+        # Only touch columns that actually change — incremental sync usually
+        # adjusts just a few — and update directly in the database, skipping
+        # the model save machinery.
+        updates = {field: F(field) + diff for field, diff in diffs.items() if diff}
+        if updates:
+            self.__class__.objects.filter(pk=self.pk).update(**updates)
+
+    @classmethod
+    def bulk_adjust(cls, diffs):
+        """
+        Adjust stats of multiple instances with a single UPDATE.
+
+        Batched alternative to calling adjust_stats() on each instance, which
+        issues one UPDATE per instance.
+
+        :arg dict diffs: maps instance pk to a tuple of the six stats diffs,
+            in the same order as the adjust_stats() arguments.
+        """
+        if not diffs:
+            return
+
+        fields = [
+            "total_strings",
+            "approved_strings",
+            "pretranslated_strings",
+            "strings_with_errors",
+            "strings_with_warnings",
+            "unreviewed_strings",
+        ]
+
+        cls.objects.filter(pk__in=diffs).update(
+            **{
+                field: Case(
+                    *[
+                        When(pk=pk, then=F(field) + instance_diffs[i])
+                        for pk, instance_diffs in diffs.items()
+                    ],
+                    default=F(field),
+                )
+                for i, field in enumerate(fields)
+            }
         )
 
     @property
@@ -638,19 +731,41 @@ class AggregatedStats(models.Model):
         return n / self.total_strings * 100 if self.total_strings else 0
 
 
+class AggregatedStatsQuerySet(models.QuerySet):
+    """
+    Base queryset for models with AggregatedStats fields, exposing SQL-level
+    equivalents of the stats arithmetic done in the model properties, so that
+    sorting and filtering on derived stats can happen in the database.
+    """
+
+    def with_missing_strings(self):
+        """Annotate the queryset with `missing`, see missing_strings."""
+        return self.annotate(
+            missing=F("total_strings")
+            - F("approved_strings")
+            - F("pretranslated_strings")
+            - F("strings_with_errors")
+            - F("strings_with_warnings")
+        )
+
+    def with_completed_strings(self):
+        """Annotate the queryset with `completed`, see completed_strings."""
+        return self.annotate(
+            completed=F("approved_strings")
+            + F("pretranslated_strings")
+            + F("strings_with_warnings")
+        )
+
+
+CLDR_PLURALS_RE = re.compile(r"\s*[0-5](?:\s*,\s*[0-5])*\s*")
+
+
 def validate_cldr(value):
-    for item in value.split(","):
-        try:
-            number = int(item.strip())
-        except ValueError:
-            return
-        if number < 0 or number >= len(Locale.CLDR_PLURALS):
-            raise ValidationError(
-                "%s must be a list of integers between 0 and 5" % value
-            )
+    if value and not CLDR_PLURALS_RE.fullmatch(value):
+        raise ValidationError("%s must be a list of integers between 0 and 5" % value)
 
 
-class LocaleQuerySet(models.QuerySet):
+class LocaleQuerySet(AggregatedStatsQuerySet):
     def unsynced(self):
         """
         Filter unsynchronized locales.
@@ -663,7 +778,7 @@ class LocaleQuerySet(models.QuerySet):
         system project.
         """
         return self.available().filter(
-            pk__in=ProjectLocale.objects.visible().values_list("locale", flat=True)
+            Exists(ProjectLocale.objects.visible().filter(locale=OuterRef("pk")))
         )
 
     def available(self):
@@ -671,7 +786,7 @@ class LocaleQuerySet(models.QuerySet):
         Available locales have at least one TranslatedResource defined.
         """
         return self.filter(
-            pk__in=TranslatedResource.objects.values_list("locale", flat=True)
+            Exists(TranslatedResource.objects.filter(locale=OuterRef("pk")))
         )
 
     def prefetch_project_locale(self, project):
@@ -682,7 +797,7 @@ class LocaleQuerySet(models.QuerySet):
             Prefetch(
                 "project_locale",
                 queryset=(
-                    ProjectLocale.objects.filter(project=project).prefetch_related(
+                    ProjectLocale.objects.filter(project=project).select_related(
                         "latest_translation__user"
                     )
                 ),
@@ -702,6 +817,80 @@ class LocaleQuerySet(models.QuerySet):
         """
         return AggregatedStats.get_top_instances(self)
 
+    def for_serialize(self):
+        """
+        Fetch only the fields needed by Locale.serialize().
+        """
+        return self.only(
+            "code",
+            "name",
+            "plural_rule",
+            "cldr_plurals",
+            "direction",
+            "script",
+            "google_translate_code",
+            "ms_translator_code",
+            "systran_translate_code",
+            "ms_terminology_code",
+        )
+
+    def aggregate_stats(self):
+        """
+        Recalculate denormalized stats of all locales in the queryset with a
+        single aggregate query and a single bulk update, instead of one
+        aggregate and one UPDATE per locale.
+        """
+        locales = list(self)
+        if not locales:
+            return
+
+        stats = (
+            TranslatedResource.objects.filter(
+                resource__project__disabled=False,
+                resource__project__system_project=False,
+                resource__project__visibility=Project.Visibility.PUBLIC,
+                locale__in=locales,
+            )
+            # Filter with EXISTS instead of joining entities, which would
+            # duplicate rows and inflate the grouped sums.
+            .filter(
+                Exists(
+                    Entity.objects.filter(resource=OuterRef("resource"), obsolete=False)
+                )
+            )
+            .values("locale")
+            .annotate(
+                total=Sum("resource__total_strings"),
+                approved=Sum("approved_strings"),
+                pretranslated=Sum("pretranslated_strings"),
+                errors=Sum("strings_with_errors"),
+                warnings=Sum("strings_with_warnings"),
+                unreviewed=Sum("unreviewed_strings"),
+            )
+        )
+        stats_map = {row["locale"]: row for row in stats}
+
+        for locale in locales:
+            row = stats_map.get(locale.pk, {})
+            locale.total_strings = row.get("total", 0)
+            locale.approved_strings = row.get("approved", 0)
+            locale.pretranslated_strings = row.get("pretranslated", 0)
+            locale.strings_with_errors = row.get("errors", 0)
+            locale.strings_with_warnings = row.get("warnings", 0)
+            locale.unreviewed_strings = row.get("unreviewed", 0)
+
+        Locale.objects.bulk_update(
+            locales,
+            [
+                "total_strings",
+                "approved_strings",
+                "pretranslated_strings",
+                "strings_with_errors",
+                "strings_with_warnings",
+                "unreviewed_strings",
+            ],
+        )
+
 
 class Locale(AggregatedStats):
     code = models.CharField(max_length=20, unique=True)
@@ -826,6 +1015,10 @@ class Locale(AggregatedStats):
         (5, "other"),
     )
 
+    # Lookup maps for CLDR_PLURALS, to avoid scanning the tuple on every call.
+    CLDR_ID_TO_PLURAL = dict(CLDR_PLURALS)
+    CLDR_PLURAL_TO_ID = {plural: id for id, plural in CLDR_PLURALS}
+
     cldr_plurals = models.CharField(
         "CLDR Plurals",
         blank=True,
@@ -925,33 +1118,34 @@ class Locale(AggregatedStats):
             "ms_terminology_code": self.ms_terminology_code,
         }
 
+    @cached_property
     def cldr_id_list(self):
-        if self.cldr_plurals == "":
-            return [1]
-        else:
-            return [int(p) for p in self.cldr_plurals.split(",")]
+        plurals = self.cldr_plurals
+        # Fast paths for the most common cases: locales with zero or one
+        # CLDR plural stored skip the split entirely.
+        if not plurals:
+            return (1,)
+        if "," not in plurals:
+            return (int(plurals),)
+        return tuple(int(p) for p in plurals.split(","))
 
     def cldr_plurals_list(self):
-        return map(Locale.cldr_id_to_plural, self.cldr_id_list())
+        return [self.CLDR_ID_TO_PLURAL[id] for id in self.cldr_id_list]
 
     def cldr_plurals_list_string(self):
         return ", ".join(self.cldr_plurals_list())
 
     @classmethod
-    def cldr_plural_to_id(self, cldr_plural):
-        for i in self.CLDR_PLURALS:
-            if i[1] == cldr_plural:
-                return i[0]
+    def cldr_plural_to_id(cls, cldr_plural):
+        return cls.CLDR_PLURAL_TO_ID.get(cldr_plural)
 
     @classmethod
-    def cldr_id_to_plural(self, cldr_id):
-        for i in self.CLDR_PLURALS:
-            if i[0] == cldr_id:
-                return i[1]
+    def cldr_id_to_plural(cls, cldr_id):
+        return cls.CLDR_ID_TO_PLURAL.get(cldr_id)
 
     @property
     def nplurals(self):
-        return len(self.cldr_id_list())
+        return len(self.cldr_id_list)
 
     def projects_permissions(self, user):
         """
@@ -967,18 +1161,6 @@ class Locale(AggregatedStats):
                 current locale.
             has_custom_translators - Flag if locale has a translators group for the project.
         """
-        locale_projects = []
-
-        def create_users_map(qs, keyfield):
-            """
-            Creates a map from query set
-            """
-            user_map = defaultdict(list)
-            for row in qs:
-                key = row.pop(keyfield)
-                user_map[key].append(row)
-            return user_map
-
         project_locales = list(
             self.project_locale.visible()
             .visible_for(user)
@@ -994,56 +1176,67 @@ class Locale(AggregatedStats):
             )
         )
 
-        projects_translators = create_users_map(
-            (
-                User.objects.filter(
-                    groups__pk__in=[
-                        project_locale["translators_group__pk"]
-                        for project_locale in project_locales
-                    ]
-                )
-                .exclude(email="")
-                .prefetch_related("groups")
-                .values("id", "first_name", "email", "groups__pk")
-                .distinct()
-                .order_by("email")
-            ),
-            "groups__pk",
+        translators = (
+            User.objects.filter(
+                groups__pk__in=[
+                    project_locale["translators_group__pk"]
+                    for project_locale in project_locales
+                ]
+            )
+            .exclude(email="")
+            .values("id", "first_name", "email", "groups__pk")
+            .distinct()
+            .order_by("groups__pk", "email")
         )
 
-        for project_locale in project_locales:
-            group_pk = project_locale["translators_group__pk"]
-            locale_projects.append(
-                (
-                    project_locale["id"],
-                    project_locale["project__slug"],
-                    project_locale["project__name"],
-                    projects_translators[group_pk],
-                    project_locale["has_custom_translators"],
-                )
+        # Rows arrive sorted by group, so a single groupby pass builds the
+        # group -> translators map without per-row dict mutation.
+        projects_translators = {
+            group_pk: [
+                {
+                    "id": row["id"],
+                    "first_name": row["first_name"],
+                    "email": row["email"],
+                }
+                for row in rows
+            ]
+            for group_pk, rows in groupby(
+                translators, key=operator.itemgetter("groups__pk")
             )
+        }
 
-        return locale_projects
+        return [
+            (
+                project_locale["id"],
+                project_locale["project__slug"],
+                project_locale["project__name"],
+                projects_translators.get(project_locale["translators_group__pk"], []),
+                project_locale["has_custom_translators"],
+            )
+            for project_locale in project_locales
+        ]
 
     def available_projects_list(self, user):
         """Get a list of available project slugs."""
-        return list(
+        slugs = list(
             self.project_set.available()
             .visible_for(user)
             .values_list("slug", flat=True)
-        ) + ["all-projects"]
+        )
+        slugs.append("all-projects")
+        return slugs
 
     def get_plural_index(self, cldr_plural):
         """Returns plural index for given cldr name."""
         cldr_id = Locale.cldr_plural_to_id(cldr_plural)
-        return self.cldr_id_list().index(cldr_id)
+        return self.cldr_id_list.index(cldr_id)
 
     def get_relative_cldr_plural(self, plural_id):
         """
         Every locale supports a subset (a list) of The CLDR Plurals forms.
         In code, we store their relative position.
         """
-        return Locale.cldr_id_to_plural(self.cldr_id_list()[plural_id])
+        return Locale.cldr_id_to_plural(self.cldr_id_list[plural_id])
 
     def get_latest_activity(self, project=None):
         return ProjectLocale.get_latest_activity(self, project)
@@ -1075,8 +1268,12 @@ class Locale(AggregatedStats):
             }
         ]
 
-    def parts_stats(self, project):
-        """Get locale-project paths with stats."""
+    def parts_stats(self, project, project_locale=None):
+        """Get locale-project paths with stats.
+
+        Pass the ProjectLocale of the project and this locale if the caller
+        already fetched it, to avoid an extra query for the summary row.
+        """
 
         def get_details(parts):
             return parts.order_by("title").values(
@@ -1098,7 +1295,9 @@ class Locale(AggregatedStats):
             get_details(translatedresources.annotate(title=F("resource__path")))
         )
 
-        all_resources = ProjectLocale.objects.get(project=project, locale=self)
+        all_resources = project_locale or ProjectLocale.objects.get(
+            project=project, locale=self
+        )
         details.append(
             {
                 "title": "all-resources",
@@ -1132,38 +1331,68 @@ class Locale(AggregatedStats):
         if not (api_key or server or profile_owner):
             return
 
-        url = f"{server}/translation/supportedLanguages"
-
-        payload = {
-            "key": api_key,
-            "source": "en",
-            "target": self.systran_translate_code,
-        }
+        # Fetch the profile in the background, so that saving a locale
+        # doesn't block on the SYSTRAN API.
+        from pontoon.base.tasks import update_systran_translate_profile
 
-        try:
-            r = requests.post(url, params=payload)
-            root = json.loads(r.content)
+        transaction.on_commit(
+            lambda: update_systran_translate_profile.delay(self.pk)
+        )
 
-            if "error" in root:
-                log.error(
-                    "Unable to retrieve SYSTRAN Profile UUID: {error}".format(
-                        error=root
-                    )
-                )
-                return
 
-            for languagePair in root["languagePairs"]:
-                for profile in languagePair["profiles"]:
-                    if profile["selectors"]["owner"] == profile_owner:
-                        self.systran_translate_profile = profile["id"]
-                        self.save(update_fields=["systran_translate_profile"])
-                        return
+class ProjectQuerySet(AggregatedStatsQuerySet):
+    def aggregate_stats(self):
+        """
+        Recalculate denormalized stats of all projects in the queryset with a
+        single aggregate query and a single bulk update, instead of one
+        aggregate and one UPDATE per project.
+        """
+        projects = list(self)
+        if not projects:
+            return
 
-        except requests.exceptions.RequestException as e:
-            log.error(f"Unable to retrieve SYSTRAN Profile UUID: {e}")
+        stats = (
+            TranslatedResource.objects.filter(resource__project__in=projects)
+            # Filter with EXISTS instead of joining entities, which would
+            # duplicate rows and inflate the grouped sums.
+            .filter(
+                Exists(
+                    Entity.objects.filter(resource=OuterRef("resource"), obsolete=False)
+                )
+            )
+            .values("resource__project")
+            .annotate(
+                total=Sum("resource__total_strings"),
+                approved=Sum("approved_strings"),
+                pretranslated=Sum("pretranslated_strings"),
+                errors=Sum("strings_with_errors"),
+                warnings=Sum("strings_with_warnings"),
+                unreviewed=Sum("unreviewed_strings"),
+            )
+        )
+        stats_map = {row["resource__project"]: row for row in stats}
 
+        for project in projects:
+            row = stats_map.get(project.pk, {})
+            project.total_strings = row.get("total", 0)
+            project.approved_strings = row.get("approved", 0)
+            project.pretranslated_strings = row.get("pretranslated", 0)
+            project.strings_with_errors = row.get("errors", 0)
+            project.strings_with_warnings = row.get("warnings", 0)
+            project.unreviewed_strings = row.get("unreviewed", 0)
+
+        Project.objects.bulk_update(
+            projects,
+            [
+                "total_strings",
+                "approved_strings",
+                "pretranslated_strings",
+                "strings_with_errors",
+                "strings_with_warnings",
+                "unreviewed_strings",
+            ],
+        )
 
-class ProjectQuerySet(models.QuerySet):
     def visible_for(self, user):
         """
         The visiblity of projects is determined by the role of the user:
@@ -1209,7 +1438,7 @@ class ProjectQuerySet(models.QuerySet):
             Prefetch(
                 "project_locale",
                 queryset=(
-                    ProjectLocale.objects.filter(locale=locale).prefetch_related(
+                    ProjectLocale.objects.filter(locale=locale).select_related(
                         "latest_translation__user"
                     )
                 ),
@@ -1229,6 +1458,20 @@ class ProjectQuerySet(models.QuerySet):
         """
         return AggregatedStats.get_top_instances(self)
 
+    def for_serialize(self):
+        """
+        Fetch only the fields needed by Project.serialize().
+        """
+        return self.select_related("contact").only(
+            "name",
+            "slug",
+            "info",
+            "langpack_url",
+            "contact__first_name",
+            "contact__email",
+            "contact__username",
+        )
+
 
 class Priority(models.IntegerChoices):
     LOWEST = 1, "Lowest"
@@ -1361,6 +1604,14 @@ class Project(AggregatedStats):
     class Meta:
         permissions = (("can_manage_project", "Can manage project"),)
         ordering = ("pk",)
+        indexes = [
+            # Covers the repeated (disabled, system_project, visibility)
+            # filters in aggregate_stats, parts_stats and visible querysets.
+            models.Index(
+                fields=["disabled", "system_project", "visibility"],
+                name="project_visibility_filter_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -1400,23 +1651,35 @@ class Project(AggregatedStats):
         super().save(*args, **kwargs)
 
         if disabled_changed or visibility_changed:
-            for locale in self.locales.all():
-                locale.aggregate_stats()
+            from pontoon.base.tasks import aggregate_stats_for_locales
+
+            locale_pks = list(self.locales.values_list("pk", flat=True))
+            transaction.on_commit(
+                lambda: aggregate_stats_for_locales.delay(locale_pks)
+            )
 
     def changed_resources(self, now):
         """
         Returns a map of resource paths and their locales
         that where changed from the last sync.
         """
-        resources = defaultdict(set)
+        resource_locales = {}
         changes = ChangedEntityLocale.objects.filter(
             entity__resource__project=self, when__lte=now
-        ).prefetch_related("locale", "entity__resource")
+        ).values_list("entity__resource__path", "locale_id")
+
+        for path, locale_id in changes:
+            resource_locales.setdefault(path, set()).add(locale_id)
 
-        for change in changes:
-            resources[change.entity.resource.path].add(change.locale)
+        # Fetch the Locale objects callers expect in one query.
+        locales = Locale.objects.in_bulk(
+            {locale_id for ids in resource_locales.values() for locale_id in ids}
+        )
 
-        return resources
+        return {
+            path: {locales[locale_id] for locale_id in ids}
+            for path, ids in resource_locales.items()
+        }
 
     @cached_property
     def unsynced_locales(self):
@@ -1424,8 +1687,13 @@ class Project(AggregatedStats):
         Project Locales that haven't been synchronized yet.
         """
         return list(
-            set(self.locales.all())
-            - set(Locale.objects.filter(translatedresources__resource__project=self))
+            self.locales.exclude(
+                Exists(
+                    TranslatedResource.objects.filter(
+                        locale=OuterRef("pk"), resource__project=self
+                    )
+                )
+            )
         )
 
     @property
@@ -1435,7 +1703,16 @@ class Project(AggregatedStats):
         another sync is required.
         """
         changes = ChangedEntityLocale.objects.filter(entity__resource__project=self)
-        return changes.exists() or self.unsynced_locales
+        return (
+            changes.exists()
+            or self.locales.exclude(
+                Exists(
+                    TranslatedResource.objects.filter(
+                        locale=OuterRef("pk"), resource__project=self
+                    )
+                )
+            ).exists()
+        )
 
     @property
     def checkout_path(self):
@@ -1445,7 +1722,7 @@ class Project(AggregatedStats):
     # For compatibility with the old sync, these properties refer to the
     # first repository by ID.
     def _repo_compat_attr(self, attribute):
-        repo = self.repositories.first()
+        repo = self.fetched_repositories[0] if self.fetched_repositories else None
         return getattr(repo, attribute) if repo is not None else None
 
     @property
@@ -1460,13 +1737,23 @@ class Project(AggregatedStats):
     def repository_path(self):
         return self._repo_compat_attr("checkout_path")
 
+    @cached_property
+    def fetched_repositories(self):
+        """Repositories of the project, fetched once per instance."""
+        return list(self.repositories.all())
+
     def repository_for_path(self, path):
         """
         Return the repository instance whose checkout contains the given
         path. If no matching repo is found, raise a ValueError.
         """
-        repo = utils.first(
-            self.repositories.all(), lambda r: path.startswith(r.checkout_path)
+        repo = next(
+            (
+                repo
+                for repo in self.fetched_repositories
+                if path.startswith(repo.checkout_path)
+            ),
+            None,
         )
 
         if repo is None:
@@ -1476,15 +1763,11 @@ class Project(AggregatedStats):
 
     @property
     def has_multi_locale_repositories(self):
-        for repo in self.repositories.all():
-            if repo.multi_locale:
-                return True
-
-        return False
+        return any(repo.multi_locale for repo in self.fetched_repositories)
 
     @property
     def has_single_repo(self):
-        return self.repositories.count() == 1
+        return len(self.fetched_repositories) == 1
 
     @cached_property
     def source_repository(self):
@@ -1496,25 +1779,24 @@ class Project(AggregatedStats):
 
             source_directories = VCSProject.SOURCE_DIR_SCORES.keys()
 
-            for repo in self.repositories.all():
+            for repo in self.fetched_repositories:
                 last_directory = os.path.basename(
                     os.path.normpath(urlparse(repo.url).path)
                 )
                 if repo.source_repo or last_directory in source_directories:
                     return repo
 
-        return self.repositories.first()
+        return self.fetched_repositories[0] if self.fetched_repositories else None
 
     def translation_repositories(self):
         """
         Returns a list of project repositories containing translations.
         """
-        pks = [
-            repo.pk
-            for repo in self.repositories.all()
+        return [
+            repo
+            for repo in self.fetched_repositories
             if repo.is_translation_repository
         ]
-        return Repository.objects.filter(pk__in=pks)
 
     def get_latest_activity(self, locale=None):
         return ProjectLocale.get_latest_activity(self, locale)
@@ -1535,23 +1817,12 @@ class Project(AggregatedStats):
         """
         Returns a map of resource paths and highest priorities of resource tags.
         """
-        resource_priority = {}
-
-        resource_priority_qs = self.tag_set.prefetch_related("resources").values(
-            "resources__path", "priority"
+        return dict(
+            self.tag_set.values("resources__path")
+            .annotate(max_priority=Max("priority"))
+            .values_list("resources__path", "max_priority")
         )
 
-        for item in resource_priority_qs:
-            path = item["resources__path"]
-            if (
-                path in resource_priority
-                and resource_priority[path] >= item["priority"]
-            ):
-                continue
-            resource_priority[path] = item["priority"]
-
-        return resource_priority
-
     def available_locales_list(self):
         """Get a list of available locale codes."""
         return list(self.locales.all().values_list("code", flat=True))
@@ -1646,14 +1917,14 @@ class UserProfile(models.Model):
     # Used to mark users as system users.
     system_user = models.BooleanField(default=False)
 
-    @property
+    @cached_property
     def preferred_locales(self):
         return Locale.objects.filter(pk__in=self.locales_order)
 
-    @property
+    @cached_property
     def sorted_locales(self):
-        locales = self.preferred_locales
-        return sorted(locales, key=lambda locale: self.locales_order.index(locale.pk))
+        order = {pk: index for index, pk in enumerate(self.locales_order)}
+        return sorted(self.preferred_locales, key=lambda locale: order[locale.pk])
 
 
 class ExternalResource(models.Model):
@@ -1685,6 +1956,66 @@ class ProjectLocaleQuerySet(models.QuerySet):
             unreviewed_strings=Sum("unreviewed_strings"),
         )
 
+    def aggregate_stats(self):
+        """
+        Recalculate denormalized stats of all project locales in the queryset
+        with a single aggregate query and a single bulk update, instead of
+        one aggregate and one UPDATE per project locale.
+        """
+        project_locales = list(self)
+        if not project_locales:
+            return
+
+        stats = (
+            TranslatedResource.objects.filter(
+                resource__project__in={pl.project_id for pl in project_locales},
+                resource__project__disabled=False,
+                locale__in={pl.locale_id for pl in project_locales},
+            )
+            # Filter with EXISTS instead of joining entities, which would
+            # duplicate rows and inflate the grouped sums.
+            .filter(
+                Exists(
+                    Entity.objects.filter(resource=OuterRef("resource"), obsolete=False)
+                )
+            )
+            .values("resource__project", "locale")
+            .annotate(
+                total=Sum("resource__total_strings"),
+                approved=Sum("approved_strings"),
+                pretranslated=Sum("pretranslated_strings"),
+                errors=Sum("strings_with_errors"),
+                warnings=Sum("strings_with_warnings"),
+                unreviewed=Sum("unreviewed_strings"),
+            )
+        )
+        stats_map = {
+            (row["resource__project"], row["locale"]): row for row in stats
+        }
+
+        for project_locale in project_locales:
+            row = stats_map.get(
+                (project_locale.project_id, project_locale.locale_id), {}
+            )
+            project_locale.total_strings = row.get("total", 0)
+            project_locale.approved_strings = row.get("approved", 0)
+            project_locale.pretranslated_strings = row.get("pretranslated", 0)
+            project_locale.strings_with_errors = row.get("errors", 0)
+            project_locale.strings_with_warnings = row.get("warnings", 0)
+            project_locale.unreviewed_strings = row.get("unreviewed", 0)
+
+        ProjectLocale.objects.bulk_update(
+            project_locales,
+            [
+                "total_strings",
+                "approved_strings",
+                "pretranslated_strings",
+                "strings_with_errors",
+                "strings_with_warnings",
+                "unreviewed_strings",
+            ],
+        )
+
     def visible_for(self, user):
         """
         Filter project locales by the visibility of their projects.
@@ -1750,7 +2081,28 @@ class ProjectLocale(AggregatedStats):
         )
 
     @classmethod
-    def get_latest_activity(cls, self, extra=None):
+    def get_many(cls, project_ids, locale_ids):
+        """
+        Fetch project locales for the given projects and locales in a
+        single query.
+
+        Callers that iterate over many (project, locale) pairs should
+        prefetch with this once and pass the resulting dict to
+        get_latest_activity() and get_chart() instead of paying one
+        query per pair.
+
+        :param project_ids: iterable of Project primary keys
+        :param locale_ids: iterable of Locale primary keys
+        :return: dict mapping (project_id, locale_id) to ProjectLocale
+        """
+        project_locales = cls.objects.filter(
+            project_id__in=project_ids, locale_id__in=locale_ids
+        ).select_related("latest_translation__user")
+
+        return {(pl.project_id, pl.locale_id): pl for pl in project_locales}
+
+    @classmethod
+    def get_latest_activity(cls, self, extra=None, project_locales=None):
         """
         Get the latest activity within project, locale
         or combination of both.
@@ -1759,6 +2111,8 @@ class ProjectLocale(AggregatedStats):
             instance of Project or Locale
         :param extra: extra filter to be used,
             instance of Project or Locale
+        :param project_locales: dict as returned by get_many(),
+            used instead of a per-pair query if given
         """
         latest_translation = None
 
@@ -1772,9 +2126,13 @@ class ProjectLocale(AggregatedStats):
         else:
             project = self if isinstance(self, Project) else extra
             locale = self if isinstance(self, Locale) else extra
-            project_locale = utils.get_object_or_none(
-                ProjectLocale, project=project, locale=locale
-            )
+
+            if project_locales is not None:
+                project_locale = project_locales.get((project.pk, locale.pk))
+            else:
+                project_locale = utils.get_object_or_none(
+                    ProjectLocale, project=project, locale=locale
+                )
 
             if project_locale is not None:
                 latest_translation = project_locale.latest_translation
@@ -1782,7 +2140,7 @@ class ProjectLocale(AggregatedStats):
         return latest_translation.latest_activity if latest_translation else None
 
     @classmethod
-    def get_chart(cls, self, extra=None):
+    def get_chart(cls, self, extra=None, project_locales=None):
         """
         Get chart for project, locale or combination of both.
 
@@ -1790,6 +2148,8 @@ class ProjectLocale(AggregatedStats):
             instance of Project or Locale
         :param extra: extra filter to be used,
             instance of Project or Locale
+        :param project_locales: dict as returned by get_many(),
+            used instead of a per-pair query if given
         """
         chart = None
 
@@ -1803,9 +2163,13 @@ class ProjectLocale(AggregatedStats):
         else:
             project = self if isinstance(self, Project) else extra
             locale = self if isinstance(self, Locale) else extra
-            project_locale = utils.get_object_or_none(
-                ProjectLocale, project=project, locale=locale
-            )
+
+            if project_locales is not None:
+                project_locale = project_locales.get((project.pk, locale.pk))
+            else:
+                project_locale = utils.get_object_or_none(
+                    ProjectLocale, project=project, locale=locale
+                )
 
             if project_locale is not None:
                 chart = cls.get_chart_dict(project_locale)
@@ -1840,20 +2204,51 @@ class ProjectLocale(AggregatedStats):
         ).distinct().aggregate_stats(self)
 
 
-def repository_url_validator(url):
-    # Regular URLs
-    validator = URLValidator(["http", "https", "ftp", "ftps", "ssh", "svn+ssh"])
+# Regular URLs
+REPOSITORY_URL_VALIDATOR = URLValidator(
+    ["http", "https", "ftp", "ftps", "ssh", "svn+ssh"]
+)
 
-    # Git SCP-like URL
-    pattern = r"git@[\w\.@]+[/:][\w-]+/[\w-]+(.git)?/?"
+# Git SCP-like URL
+GIT_SCP_URL_RE = re.compile(r"git@[\w\.@]+[/:][\w-]+/[\w-]+(.git)?/?")
 
+
+def repository_url_validator(url):
     try:
-        validator(url)
+        REPOSITORY_URL_VALIDATOR(url)
     except ValidationError:
-        if not re.match(pattern, url):
+        if not GIT_SCP_URL_RE.match(url):
             raise ValidationError("Invalid URL")
 
 
+def _hg_mozilla_api_config(parsed_url):
+    endpoint = "https://{netloc}/{path}/json-rev/default".format(
+        netloc=parsed_url.netloc, path=parsed_url.path.strip("/")
+    )
+    return {
+        "endpoint": endpoint,
+        "get_key": lambda x: x["node"],
+    }
+
+
+def _bitbucket_api_config(parsed_url):
+    endpoint = "https://api.bitbucket.org/2.0/repositories/{path}/commit/default".format(
+        path=parsed_url.path.strip("/")
+    )
+    return {
+        "endpoint": endpoint,
+        "get_key": lambda x: x["hash"],
+    }
+
+
+# Dispatch table for Repository.api_config: URL prefixes of supported hosts
+# and builders that turn an already parsed repo URL into an API config.
+API_CONFIG_BUILDERS = (
+    ("ssh://hg.mozilla.org/", _hg_mozilla_api_config),
+    ("ssh://hg@bitbucket.org/", _bitbucket_api_config),
+)
+
+
 class Repository(models.Model):
     """
     A remote VCS repository that stores resource files for a project.
@@ -1910,7 +2305,7 @@ class Repository(models.Model):
             repo_kind = "SourceRepository"
         return f"<{repo_kind}[{self.pk}:{self.type}:{self.url}]"
 
-    @property
+    @cached_property
     def multi_locale(self):
         """
         Checks if url contains locale code variable. System will replace
@@ -1919,21 +2314,21 @@ class Repository(models.Model):
         """
         return "{locale_code}" in self.url
 
-    @property
+    @cached_property
     def is_source_repository(self):
         """
         Returns true if repository contains source strings.
         """
         return self == self.project.source_repository
 
-    @property
+    @cached_property
     def is_translation_repository(self):
         """
         Returns true if repository contains translations.
         """
         return self.project.has_single_repo or not self.is_source_repository
 
-    @property
+    @cached_property
     def checkout_path(self):
         """
         Path where the checkout for this repo is located. Does not
@@ -1945,15 +2340,23 @@ class Repository(models.Model):
         # information, like https://hg.mozilla.org/gaia-l10n/fr/.
         # No worry about overlap between repos, any overlap of locale
         # directories is an error already.
-        path_components += urlparse(self.url).path.split("/")
+        # Extract the path with str.partition; urlparse builds a full
+        # ParseResult and is several times slower for these simple URLs.
+        if "://" in self.url:
+            raw_path = self.url.split("://", 1)[1].partition("/")[2]
+        else:
+            raw_path = self.url
+        path_components += raw_path.split("/")
         if self.multi_locale:
             path_components = [c for c in path_components if c != "{locale_code}"]
 
         if self.source_repo:
             path_components.append("templates")
 
-        # Remove trailing separator for consistency.
-        return os.path.join(*path_components).rstrip(os.sep)
+        # Remove trailing separator for consistency. Checkout paths are
+        # always POSIX-style, so a plain join beats os.path.join, which
+        # re-checks every component for absoluteness.
+        return "/".join(c for c in path_components if c).rstrip("/")
 
     @cached_property
     def api_config(self):
@@ -1966,25 +2369,9 @@ class Repository(models.Model):
         """
         url = self.url
 
-        if url.startswith("ssh://hg.mozilla.org/"):
-            parsed_url = urlparse(url)
-            endpoint = "https://{netloc}/{path}/json-rev/default".format(
-                netloc=parsed_url.netloc, path=parsed_url.path.strip("/")
-            )
-            return {
-                "endpoint": endpoint,
-                "get_key": lambda x: x["node"],
-            }
-
-        if url.startswith("ssh://hg@bitbucket.org/"):
-            parsed_url = urlparse(url)
-            endpoint = "https://api.bitbucket.org/2.0/repositories/{path}/commit/default".format(
-                path=parsed_url.path.strip("/")
-            )
-            return {
-                "endpoint": endpoint,
-                "get_key": lambda x: x["hash"],
-            }
+        for prefix, build_config in API_CONFIG_BUILDERS:
+            if url.startswith(prefix):
+                return build_config(urlparse(url))
 
         return None
 
@@ -2011,6 +2398,26 @@ class Repository(models.Model):
 
         return self.url.format(locale_code=locale.code)
 
+    @cached_property
+    def _project_locales(self):
+        """
+        Locales of the project, materialized once per instance for
+        methods that get called repeatedly on the same repository.
+        """
+        return tuple(self.project.locales.all())
+
+    @cached_property
+    def _locale_path_index(self):
+        """
+        Mapping of locale checkout paths to locale-specific repo URLs,
+        in project locale order. Built once per instance, so resolving
+        many paths doesn't re-walk the locale list.
+        """
+        return {
+            self.locale_checkout_path(locale): self.locale_url(locale)
+            for locale in self._project_locales
+        }
+
     def url_for_path(self, path):
         """
         Determine the locale-specific repo URL for the given path.
@@ -2018,11 +2425,18 @@ class Repository(models.Model):
         If this is not a multi-locale repo, raise a ValueError. If no
         repo is found for the given path, also raise a ValueError.
         """
-        for locale in self.project.locales.all():
-            if path.startswith(self.locale_checkout_path(locale)):
-                return self.locale_url(locale)
+        index = self._locale_path_index
 
-        raise ValueError(f"No repo found for path: {path}")
+        # Walk up the parents of the path, so the lookup is O(path depth)
+        # instead of O(locales).
+        parent = path
+        while parent not in index:
+            next_parent = os.path.dirname(parent)
+            if next_parent == parent:
+                raise ValueError(f"No repo found for path: {path}")
+            parent = next_parent
+
+        return index[parent]
 
     def pull(self, locales=None):
         """
@@ -2042,19 +2456,40 @@ class Repository(models.Model):
             current_revisions = {}
             locales = locales or self.project.locales.all()
 
-            for locale in locales:
-                repo_type = self.type
-                url = self.locale_url(locale)
-                checkout_path = self.locale_checkout_path(locale)
-                repo_branch = self.branch
+            repo_type = self.type
+            repo_branch = self.branch
+
+            def pull_locale(url, checkout_path):
+                update_from_vcs(repo_type, url, checkout_path, repo_branch)
+                return get_revision(repo_type, checkout_path)
+
+            # Pulls are dominated by VCS subprocess and network latency,
+            # so run the per-locale pulls in a thread pool instead of
+            # serially waiting out each locale.
+            with ThreadPoolExecutor(
+                max_workers=settings.VCS_PULL_CONCURRENCY
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        pull_locale,
+                        self.locale_url(locale),
+                        self.locale_checkout_path(locale),
+                    ): locale
+                    for locale in locales
+                }
 
-                try:
-                    update_from_vcs(repo_type, url, checkout_path, repo_branch)
-                    current_revisions[locale.code] = get_revision(
-                        repo_type, checkout_path
-                    )
-                except PullFromRepositoryException as e:
-                    log.error(f"{repo_type.upper()} Pull Error for {url}: {e}")
+                for future in as_completed(futures):
+                    locale = futures[future]
+                    try:
+                        current_revisions[locale.code] = future.result()
+                    except PullFromRepositoryException as e:
+                        log.error(
+                            "{type} Pull Error for {url}: {error}".format(
+                                type=repo_type.upper(),
+                                url=self.locale_url(locale),
+                                error=e,
+                            )
+                        )
 
             return current_revisions
 
@@ -2080,12 +2515,14 @@ class Repository(models.Model):
         current_revisions = {}
 
         if self.multi_locale:
-            for locale in self.project.locales.all():
+            base_path = self.checkout_path
+
+            for locale in self._project_locales:
                 if locales is not None and locale not in locales:
                     revision = self.last_synced_revisions.get(locale.code)
                 else:
                     revision = get_revision(
-                        self.type, self.locale_checkout_path(locale)
+                        self.type, os.path.join(base_path, locale.code)
                     )
 
                 if revision:
@@ -2151,24 +2588,30 @@ class Resource(models.Model):
     SOURCE_EXTENSIONS = ["pot"]  # Extensions of source-only formats.
     ALLOWED_EXTENSIONS = Format.values + SOURCE_EXTENSIONS
 
-    ASYMMETRIC_FORMATS = {
-        Format.DTD,
-        Format.FTL,
-        Format.INC,
-        Format.INI,
-        Format.JSON,
-        Format.PROPERTIES,
-        Format.XML,
-    }
+    # Raw strings rather than Format members, so that membership checks
+    # against the stored format column compare str to str directly.
+    ASYMMETRIC_FORMATS = frozenset(
+        {
+            Format.DTD.value,
+            Format.FTL.value,
+            Format.INC.value,
+            Format.INI.value,
+            Format.JSON.value,
+            Format.PROPERTIES.value,
+            Format.XML.value,
+        }
+    )
 
     # Formats that allow empty translations
-    EMPTY_TRANSLATION_FORMATS = {
-        Format.DTD,
-        Format.INC,
-        Format.INI,
-        Format.PROPERTIES,
-        Format.XML,
-    }
+    EMPTY_TRANSLATION_FORMATS = frozenset(
+        {
+            Format.DTD.value,
+            Format.INC.value,
+            Format.INI.value,
+            Format.PROPERTIES.value,
+            Format.XML.value,
+        }
+    )
 
     objects = ResourceQuerySet.as_manager()
 
@@ -2193,80 +2636,64 @@ class Resource(models.Model):
 
     @classmethod
     def get_path_format(self, path):
-        filename, extension = os.path.splitext(path)
-        path_format = extension[1:].lower()
-
-        # Special case: pot files are considered the po format
-        if path_format == "pot":
-            return "po"
-        elif path_format == "xlf":
-            return "xliff"
-        else:
-            return path_format
+        return _path_format_from_extension(os.path.splitext(path)[1].lower())
+
+
+# The set of file extensions in use is tiny, so cache the mapping instead of
+# re-running the string massaging once per file during sync.
+@lru_cache(maxsize=64)
+def _path_format_from_extension(extension):
+    path_format = extension[1:]
+
+    # Special case: pot files are considered the po format
+    if path_format == "pot":
+        return "po"
+    elif path_format == "xlf":
+        return "xliff"
+    else:
+        return path_format
 
 
 class EntityQuerySet(models.QuerySet):
-    def get_filtered_entities(
-        self, locale, query, rule, project=None, match_all=True, prefetch=None
-    ):
-        """Return a QuerySet of values of entity PKs matching the locale, query and rule.
+    def get_filtered_entities(self, locale, query, project=None, match_all=True):
+        """Return an Exists predicate matching entities by the locale and query.
 
         Filter entities that match the given filter provided by the `locale` and `query`
-        parameters. For performance reasons the `rule` parameter is also provided to filter
-        entities in python instead of the DB.
+        parameters.
 
         :arg Locale locale: a Locale object to get translations for
         :arg Q query: a django ORM Q() object describing translations to filter
-        :arg function rule: a lambda function implementing the `query` logic
-        :arg boolean match_all: if true, all plural forms must match the rule.
+        :arg boolean match_all: if true, all plural forms must match the query.
             Otherwise, only one matching is enough
-        :arg prefetch django.db.models.Prefetch prefetch: if set, it's used to control the
-            operation of prefetch_related() on the query.
 
-        :returns: a QuerySet of values of entity PKs
+        :returns: an Exists predicate correlated on the entity pk, to be used
+            in a filter on Entity
 
         """
-        # First, separately filter entities with plurals (for performance reasons)
+        # First, separately filter entities with plurals (for performance reasons).
+        # Count the distinct plural forms with a matching translation per entity
+        # in SQL, instead of pulling all candidate translations into Python.
         plural_pks = []
-
-        if locale.nplurals:
-            # For each entity with plurals, fetch translations matching the query.
-            plural_candidates = self.exclude(string_plural="").prefetch_related(
-                Prefetch(
-                    "translation_set",
-                    queryset=(
-                        Translation.objects.filter(locale=locale)
-                        .filter(query)
-                        .prefetch_related(prefetch)
-                    ),
-                    to_attr="fetched_translations",
-                )
+        plural_entities = self.exclude(string_plural="")
+
+        # The exists() probe is a cheap LIMIT 1 query that keeps the plural
+        # subquery out of the final filter for the common case of projects
+        # and locales without any plural entities.
+        if locale.nplurals and plural_entities.exists():
+            plural_pks = (
+                Translation.objects.filter(locale=locale, entity__in=plural_entities)
+                .filter(query)
+                .values("entity")
+                .annotate(matched_plural_forms=Count("plural_form", distinct=True))
             )
 
-            # Walk through the plural forms one by one and check that:
-            #  - they have a translation
-            #  - the translation matches the rule
-            for candidate in plural_candidates:
-                count = 0
-                for i in range(locale.nplurals):
-                    candidate_translations = [
-                        translation
-                        for translation in candidate.fetched_translations
-                        if translation.plural_form == i
-                    ]
-                    if len(candidate_translations) and rule(candidate_translations[0]):
-                        count += 1
-
-                        # No point going on if we don't care about matching all.
-                        if not match_all:
-                            continue
-
-                # If `match_all` is True, we want all plural forms to have a match.
-                # Otherwise, just one of them matching is enough.
-                if (match_all and count == locale.nplurals) or (
-                    not match_all and count
-                ):
-                    plural_pks.append(candidate.pk)
+            # If `match_all` is True, we want all plural forms to have a match.
+            # Otherwise, just one of them matching is enough, which any entity
+            # with at least one matching translation satisfies.
+            if match_all:
+                plural_pks = plural_pks.filter(matched_plural_forms=locale.nplurals)
+
+            plural_pks = plural_pks.values_list("entity", flat=True)
 
         translations = Translation.objects.filter(locale=locale)
 
@@ -2275,11 +2702,17 @@ class EntityQuerySet(models.QuerySet):
         if project and project.slug != "all-projects":
             translations = translations.filter(entity__resource__project=project)
 
-        # Finally, we return a query that returns both the matching entities with no
-        # plurals and the entities with plurals that were stored earlier.
-        return translations.filter(
-            Q(Q(entity__string_plural="") & query) | Q(entity_id__in=plural_pks)
-        ).values("entity")
+        # Finally, we return a predicate matching both entities with no plurals
+        # and the entities with plurals that were matched earlier. An EXISTS
+        # semi-join correlated on the outer entity lets the planner stop at the
+        # first matching translation, instead of building the full set of
+        # matching entity ids for a pk__in subquery.
+        return Exists(
+            translations.filter(
+                Q(Q(entity__string_plural="") & query) | Q(entity_id__in=plural_pks),
+                entity=OuterRef("pk"),
+            )
+        )
 
     def missing(self, locale, project=None):
         """Return a filter to be used to select entities marked as "missing".
@@ -2293,10 +2726,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return ~Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(approved=True) | Q(pretranslated=True),
-                lambda x: x.approved or x.pretranslated,
                 project=project,
             )
         )
@@ -2313,14 +2745,11 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 (Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
                 & Q(warnings__isnull=False),
-                lambda x: (x.approved or x.pretranslated or x.fuzzy)
-                and x.warnings.count(),
                 match_all=False,
-                prefetch=Prefetch("warnings"),
                 project=project,
             )
         )
@@ -2337,14 +2766,11 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 (Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
                 & Q(errors__isnull=False),
-                lambda x: (x.approved or x.pretranslated or x.fuzzy)
-                and x.errors.count(),
                 match_all=False,
-                prefetch=Prefetch("errors"),
                 project=project,
             )
         )
@@ -2360,10 +2786,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(pretranslated=True, warnings__isnull=True, errors__isnull=True),
-                lambda x: x.pretranslated,
                 project=project,
             )
         )
@@ -2379,10 +2804,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(approved=True, warnings__isnull=True, errors__isnull=True),
-                lambda x: x.approved,
                 project=project,
             )
         )
@@ -2399,13 +2823,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(approved=False, rejected=False, pretranslated=False, fuzzy=False),
-                lambda x: not x.approved
-                and not x.rejected
-                and not x.pretranslated
-                and not x.fuzzy,
                 match_all=False,
                 project=project,
             )
@@ -2422,10 +2842,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(rejected=True),
-                lambda x: x.rejected,
                 match_all=False,
                 project=project,
             )
@@ -2441,10 +2860,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return ~Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(approved=True) | Q(pretranslated=True) | Q(rejected=False),
-                lambda x: x.approved or x.pretranslated or not x.rejected,
                 project=project,
             )
         )
@@ -2461,10 +2879,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(fuzzy=True, warnings__isnull=True, errors__isnull=True),
-                lambda x: x.fuzzy,
                 project=project,
             )
         )
@@ -2478,10 +2895,9 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(string=""),
-                lambda x: x.string == "",
                 match_all=False,
                 project=project,
             )
@@ -2499,22 +2915,21 @@ class EntityQuerySet(models.QuerySet):
 
         """
         return Q(
-            pk__in=self.get_filtered_entities(
+            self.get_filtered_entities(
                 locale,
                 Q(active=True)
                 & (
                     Q(string=F("entity__string")) | Q(string=F("entity__string_plural"))
                 ),
-                lambda x: x.active
-                and (x.string == x.entity.string or x.string == x.entity.string_plural),
                 match_all=False,
                 project=project,
             )
         )
 
     def authored_by(self, locale, emails):
-        # Validate if user passed a real email
-        sanitized_emails = filter(utils.is_email, emails)
+        # Validate if user passed a real email. Materialize to a list:
+        # a filter object is always truthy and can only be consumed once.
+        sanitized_emails = [email for email in emails if utils.is_email(email)]
         query = Q()
 
         if sanitized_emails:
@@ -2530,7 +2945,7 @@ class EntityQuerySet(models.QuerySet):
 
     def reviewed_by(self, locale, emails):
         # Validate if user passed a real email
-        sanitized_emails = filter(utils.is_email, emails)
+        sanitized_emails = [email for email in emails if utils.is_email(email)]
 
         if sanitized_emails:
             return Q(translation__locale=locale) & (
@@ -2571,6 +2986,29 @@ class EntityQuerySet(models.QuerySet):
             )
         )
 
+    def prefetch_active_translations_bulk(self, locales):
+        """
+        Prefetch active translations for all given locales with a single
+        query. Use instead of per-locale prefetch_active_translations()
+        calls when rendering entities across locales; callers pick the
+        translations of a locale out of `active_translations_all` by
+        locale_id.
+        """
+        return self.prefetch_related(
+            Prefetch(
+                "translation_set",
+                queryset=(
+                    Translation.objects.filter(
+                        locale__in=locales, active=True
+                    ).prefetch_related(
+                        "errors",
+                        "warnings",
+                    )
+                ),
+                to_attr="active_translations_all",
+            )
+        )
+
     def prefetch_alternative_originals(self, code):
         """
         Prefetch approved translations for given preferred source locale.
@@ -2602,28 +3040,32 @@ class EntityQuerySet(models.QuerySet):
 
         # Mark most recent unreviewed suggestions without active siblings
         # for any given combination of (locale, entity, plural_form) as active.
-        unreviewed_pks = set()
-        unreviewed = translations.filter(
-            approved=False,
-            pretranslated=False,
-            fuzzy=False,
-            rejected=False,
-        ).values_list("entity", "plural_form")
-
-        for entity, plural_form in unreviewed:
-            siblings = (
-                Translation.objects.filter(
-                    entity=entity,
-                    locale=locale,
-                    plural_form=plural_form,
-                )
-                .exclude(rejected=True)
-                .order_by("-active", "-date")
+        # DISTINCT ON picks the first row per (entity, plural_form) group in a
+        # single pass, replacing the per-pair sibling lookups that used to
+        # issue one ORDER BY query per pair. Active translations sort first
+        # within each group, so an inactive first row means the group has no
+        # active sibling and the row is its most recent unreviewed suggestion.
+        with connection.cursor() as cursor:
+            cursor.execute(
+                """
+                UPDATE base_translation
+                SET active = TRUE
+                WHERE id IN
+                    (SELECT id FROM
+                        (SELECT DISTINCT ON (entity_id, plural_form) id, active
+                        FROM base_translation
+                        WHERE entity_id = ANY(%(entity_ids)s)
+                        AND locale_id = %(locale_id)s
+                        AND NOT rejected
+                        ORDER BY entity_id, plural_form, active DESC, date DESC
+                        ) first_rows
+                    WHERE NOT active)
+                """,
+                {
+                    "entity_ids": list(self.values_list("id", flat=True)),
+                    "locale_id": locale.id,
+                },
             )
-            if siblings and not siblings[0].active:
-                unreviewed_pks.add(siblings[0].pk)
-
-        translations.filter(pk__in=unreviewed_pks).update(active=True)
 
     def get_or_create(self, defaults=None, **kwargs):
         kwargs["word_count"] = get_word_count(kwargs["string"])
@@ -2631,8 +3073,11 @@ class EntityQuerySet(models.QuerySet):
 
     def bulk_update(self, objs, fields, batch_size=None):
         if "string" in fields:
+            # Count words with the compiled pattern directly: for large
+            # imports the per-object function call overhead adds up.
+            findall = WORD_COUNT_RE.findall
             for obj in objs:
-                obj.word_count = get_word_count(obj.string)
+                obj.word_count = len(findall(obj.string))
             if "word_count" not in fields:
                 fields.append("word_count")
         super().bulk_update(objs, fields=fields, batch_size=batch_size)
@@ -2695,68 +3140,60 @@ class Entity(DirtyFieldsMixin, models.Model):
         :return: a dictionary with stats for an Entity, all keys are suffixed with `_diff` to
             make them easier to pass into adjust_all_stats.
         """
-        translations = list(
-            self.translation_set.filter(locale=locale).prefetch_related(
-                "errors",
-                "warnings",
-            )
-        )
-
-        approved_strings_count = len(
-            [
-                t
-                for t in translations
-                if t.approved and not (t.errors.exists() or t.warnings.exists())
-            ]
-        )
-
-        pretranslated_strings_count = len(
-            [
-                t
-                for t in translations
-                if t.pretranslated and not (t.errors.exists() or t.warnings.exists())
-            ]
+        # All counts come from a single conditional aggregate, instead of
+        # loading the full translation rows with their errors and warnings
+        # into Python and counting there. Distinct counts are required
+        # because the errors and warnings joins multiply rows.
+        reviewed = Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True)
+        counts = self.translation_set.filter(locale=locale).aggregate(
+            approved_count=Count(
+                "pk",
+                distinct=True,
+                filter=Q(approved=True, errors__isnull=True, warnings__isnull=True),
+            ),
+            pretranslated_count=Count(
+                "pk",
+                distinct=True,
+                filter=Q(
+                    pretranslated=True, errors__isnull=True, warnings__isnull=True
+                ),
+            ),
+            errors_count=Count(
+                "pk",
+                distinct=True,
+                filter=reviewed & Q(errors__isnull=False),
+            ),
+            warnings_count=Count(
+                "pk",
+                distinct=True,
+                filter=reviewed & Q(warnings__isnull=False),
+            ),
+            unreviewed_count=Count(
+                "pk",
+                distinct=True,
+                filter=Q(
+                    approved=False, pretranslated=False, fuzzy=False, rejected=False
+                ),
+            ),
         )
 
         if self.string_plural:
-            approved = int(approved_strings_count == locale.nplurals)
-            pretranslated = int(pretranslated_strings_count == locale.nplurals)
+            approved = int(counts["approved_count"] == locale.nplurals)
+            pretranslated = int(counts["pretranslated_count"] == locale.nplurals)
 
         else:
-            approved = int(approved_strings_count > 0)
-            pretranslated = int(pretranslated_strings_count > 0)
+            approved = int(counts["approved_count"] > 0)
+            pretranslated = int(counts["pretranslated_count"] > 0)
 
         if not (approved or pretranslated):
-            has_errors = bool(
-                [
-                    t
-                    for t in translations
-                    if (t.approved or t.pretranslated or t.fuzzy) and t.errors.exists()
-                ]
-            )
-            has_warnings = bool(
-                [
-                    t
-                    for t in translations
-                    if (t.approved or t.pretranslated or t.fuzzy)
-                    and t.warnings.exists()
-                ]
-            )
-
-            errors = int(has_errors)
-            warnings = int(has_warnings)
+            errors = int(counts["errors_count"] > 0)
+            warnings = int(counts["warnings_count"] > 0)
 
         else:
             errors = 0
             warnings = 0
 
-        unreviewed_count = len(
-            [
-                t
-                for t in translations
-                if not (t.approved or t.pretranslated or t.fuzzy or t.rejected)
-            ]
-        )
+        unreviewed_count = counts["unreviewed_count"]
 
         return {
             "total_strings_diff": 0,
@@ -2786,7 +3223,13 @@ class Entity(DirtyFieldsMixin, models.Model):
         Check if translations in the given locale have changed since the
         last sync.
         """
-        return locale in self.changed_locales.all()
+        # Use the prefetch cache when available (sync prefetches
+        # changed_locales), otherwise ask the database for existence
+        # instead of fetching the whole relation.
+        if "changed_locales" in getattr(self, "_prefetched_objects_cache", {}):
+            return locale in self.changed_locales.all()
+
+        return self.changed_locales.filter(pk=locale.pk).exists()
 
     def get_active_translation(self, plural_form=None):
         """
@@ -2796,7 +3239,14 @@ class Entity(DirtyFieldsMixin, models.Model):
         translations = self.active_translations
 
         if plural_form is not None:
-            translations = [t for t in translations if t.plural_form == plural_form]
+            # Index the prefetched translations by plural form once, so
+            # looking up each form isn't a fresh scan of the list.
+            if not hasattr(self, "_active_translations_by_plural_form"):
+                self._active_translations_by_plural_form = {
+                    t.plural_form: t for t in translations
+                }
+            translation = self._active_translations_by_plural_form.get(plural_form)
+            return translation if translation is not None else Translation()
 
         return translations[0] if translations else Translation()
 
@@ -2804,28 +3254,49 @@ class Entity(DirtyFieldsMixin, models.Model):
         """
         Reset active translation for given entity, locale and plural form.
         Return active translation if exists or empty Translation instance.
-        """
-        translations = self.translation_set.filter(locale=locale)
-
-        if plural_form is not None:
-            translations = translations.filter(plural_form=plural_form)
-
-        translations.update(active=False)
 
-        candidates = translations.filter(rejected=False).order_by(
-            "-approved", "-pretranslated", "-fuzzy", "-date"
+        Runs as a single statement instead of a deactivate UPDATE, a
+        candidate SELECT and a save: one CTE picks the winner, another
+        deactivates its siblings, and the outer UPDATE activates the
+        winner and returns the row. The winner is excluded from the
+        deactivation because Postgres only applies one update per row
+        and statement.
+        """
+        active_translations = list(
+            Translation.objects.raw(
+                """
+                WITH winner AS (
+                    SELECT id FROM base_translation
+                    WHERE entity_id = %(entity_id)s
+                    AND locale_id = %(locale_id)s
+                    AND (%(plural_form)s IS NULL OR plural_form = %(plural_form)s)
+                    AND NOT rejected
+                    ORDER BY approved DESC, pretranslated DESC, fuzzy DESC, date DESC
+                    LIMIT 1
+                ),
+                cleared AS (
+                    UPDATE base_translation
+                    SET active = FALSE
+                    WHERE entity_id = %(entity_id)s
+                    AND locale_id = %(locale_id)s
+                    AND (%(plural_form)s IS NULL OR plural_form = %(plural_form)s)
+                    AND active
+                    AND id IS DISTINCT FROM (SELECT id FROM winner)
+                )
+                UPDATE base_translation
+                SET active = TRUE
+                WHERE id IN (SELECT id FROM winner)
+                RETURNING *
+                """,
+                {
+                    "entity_id": self.pk,
+                    "locale_id": locale.pk,
+                    "plural_form": plural_form,
+                },
+            )
         )
 
-        if candidates:
-            active_translation = candidates[0]
-            active_translation.active = True
-
-            # Do not trigger the overridden Translation.save() method
-            super(Translation, active_translation).save(update_fields=["active"])
-
-            return active_translation
-        else:
-            return Translation()
+        return active_translations[0] if active_translations else Translation()
 
     def reset_term_translation(self, locale):
         """
@@ -2840,14 +3311,17 @@ class Entity(DirtyFieldsMixin, models.Model):
         """
         term = self.term
 
-        try:
-            approved_translation = self.translation_set.get(
-                locale=locale, approved=True
+        approved_text = (
+            self.translation_set.filter(locale=locale, approved=True)
+            .values_list("string", flat=True)
+            .first()
+        )
+
+        if approved_text is not None:
+            term.translations.update_or_create(
+                locale=locale, defaults={"text": approved_text}
             )
-            term_translation, _ = term.translations.get_or_create(locale=locale)
-            term_translation.text = approved_translation.string
-            term_translation.save(update_fields=["text"])
-        except Translation.DoesNotExist:
+        else:
             term.translations.filter(locale=locale).delete()
 
     @classmethod
@@ -2877,14 +3351,14 @@ class Entity(DirtyFieldsMixin, models.Model):
         post_filters = []
 
         if time:
-            if re.match("^[0-9]{12}-[0-9]{12}$", time):
+            if TIME_RANGE_RE.match(time):
                 start, end = utils.parse_time_interval(time)
                 pre_filters.append(
                     Entity.objects.between_time_interval(locale, start, end)
                 )
 
         if review_time:
-            if re.match("^[0-9]{12}-[0-9]{12}$", review_time):
+            if TIME_RANGE_RE.match(review_time):
                 start, end = utils.parse_time_interval(review_time)
                 pre_filters.append(
                     Entity.objects.between_review_time_interval(locale, start, end)
@@ -2905,9 +3379,12 @@ class Entity(DirtyFieldsMixin, models.Model):
             )
 
         if pre_filters:
-            entities = Entity.objects.filter(
-                pk__in=Entity.objects.filter(Q(*pre_filters))
-            )
+            # Apply the filters directly instead of wrapping them in a
+            # pk__in self-subquery; a single filter() call keeps them
+            # matching the same translation row, and distinct() removes
+            # the duplicates the translation join introduces (the job the
+            # subquery wrapper used to do).
+            entities = Entity.objects.filter(*pre_filters).distinct()
         else:
             entities = Entity.objects.all()
 
@@ -2974,31 +3451,41 @@ class Entity(DirtyFieldsMixin, models.Model):
         if search:
             search_list = utils.get_search_phrases(search)
 
-            translation_filters = (
-                Q(translation__string__icontains_collate=(search, locale.db_collation))
-                & Q(translation__locale=locale)
-                for search in search_list
-            )
-            translation_matches = entities.filter(*translation_filters).values_list(
-                "id", flat=True
-            )
-
-            entity_filters = (
-                Q(string__icontains=search)
-                | Q(string_plural__icontains=search)
-                | Q(comment__icontains=search)
-                | Q(group_comment__icontains=search)
-                | Q(resource_comment__icontains=search)
-                | Q(key__icontains=search)
-                for search in search_list
-            )
-            entity_matches = entities.filter(*entity_filters).values_list(
-                "id", flat=True
-            )
+            if search_list:
+                translation_filters = reduce(
+                    operator.and_,
+                    (
+                        Q(
+                            translation__string__icontains_collate=(
+                                search,
+                                locale.db_collation,
+                            )
+                        )
+                        for search in search_list
+                    ),
+                ) & Q(translation__locale=locale)
+
+                entity_filters = reduce(
+                    operator.and_,
+                    (
+                        Q(string__icontains=search)
+                        | Q(string_plural__icontains=search)
+                        | Q(comment__icontains=search)
+                        | Q(group_comment__icontains=search)
+                        | Q(resource_comment__icontains=search)
+                        | Q(key__icontains=search)
+                        for search in search_list
+                    ),
+                )
 
-            entities = Entity.objects.filter(
-                pk__in=set(list(translation_matches) + list(entity_matches))
-            )
+                # A single OR'd filter replaces the two id-list queries that
+                # used to be unioned in Python and sent back as a pk__in list.
+                # Both branches stay in one filter() call, so all phrases must
+                # still match the same translation row. The translation join
+                # can duplicate entities, hence the distinct.
+                entities = entities.filter(
+                    translation_filters | entity_filters
+                ).distinct()
 
         if exclude_entities:
             entities = entities.exclude(pk__in=exclude_entities)
@@ -3017,58 +3504,171 @@ class Entity(DirtyFieldsMixin, models.Model):
         entities,
         is_sibling=False,
     ):
-        entities_array = []
+        # Avoids a circular import: pontoon.checks.models imports Translation.
+        from pontoon.checks.models import Error, Warning
+
+        # Project just the fields the payload reads instead of instantiating
+        # Entity, Resource and Project model objects per row; model setup
+        # cost dominates this hot listing path.
+        entities = list(
+            entities.values(
+                "pk",
+                "string",
+                "string_plural",
+                "key",
+                "context",
+                "comment",
+                "group_comment",
+                "resource_comment",
+                "order",
+                "source",
+                "obsolete",
+                "resource__path",
+                "resource__format",
+                "resource__project_id",
+            )
+        )
+        entity_pks = [entity["pk"] for entity in entities]
 
-        # Prefetch related Translations, Resources, Projects and ProjectLocales
-        entities = entities.prefetch_active_translations(locale).prefetch_related(
-            Prefetch(
-                "resource__project__project_locale",
-                queryset=ProjectLocale.objects.filter(locale=locale),
-                to_attr="projectlocale",
+        # Active translations of the given locale, in serialized form, with
+        # error and warning messages gathered in two grouped queries.
+        translations = list(
+            Translation.objects.filter(
+                entity_id__in=entity_pks, locale=locale, active=True
+            ).values(
+                "pk",
+                "entity_id",
+                "plural_form",
+                "string",
+                "approved",
+                "rejected",
+                "pretranslated",
+                "fuzzy",
             )
         )
+        translation_pks = [translation["pk"] for translation in translations]
+
+        errors = {}
+        for translation_id, message in Error.objects.filter(
+            translation_id__in=translation_pks
+        ).values_list("translation_id", "message"):
+            errors.setdefault(translation_id, []).append(message)
+
+        warnings = {}
+        for translation_id, message in Warning.objects.filter(
+            translation_id__in=translation_pks
+        ).values_list("translation_id", "message"):
+            warnings.setdefault(translation_id, []).append(message)
+
+        active_translations = {}
+        first_active_translations = {}
+        for translation in translations:
+            serialized = {
+                "pk": translation["pk"],
+                "string": translation["string"],
+                "approved": translation["approved"],
+                "rejected": translation["rejected"],
+                "pretranslated": translation["pretranslated"],
+                "fuzzy": translation["fuzzy"],
+                "errors": errors.get(translation["pk"], []),
+                "warnings": warnings.get(translation["pk"], []),
+            }
+            active_translations[
+                (translation["entity_id"], translation["plural_form"])
+            ] = serialized
+            first_active_translations.setdefault(translation["entity_id"], serialized)
+
+        empty_translation = {
+            "pk": None,
+            "string": "",
+            "approved": False,
+            "rejected": False,
+            "pretranslated": False,
+            "fuzzy": False,
+            "errors": [],
+            "warnings": [],
+        }
 
+        # Approved translations of the preferred source locale, replacing the
+        # displayed originals where available.
+        alternative_originals = {}
         if preferred_source_locale != "":
-            entities = entities.prefetch_alternative_originals(preferred_source_locale)
+            for entity_id, string in Translation.objects.filter(
+                entity_id__in=entity_pks,
+                locale__code=preferred_source_locale,
+                approved=True,
+            ).values_list("entity_id", "string"):
+                alternative_originals.setdefault(entity_id, []).append(string)
+
+        # The same project repeats across most entities, so serialize it and
+        # read its readonly flag once per project instead of once per entity.
+        project_ids = {entity["resource__project_id"] for entity in entities}
+        projects_serialized = {
+            project.pk: project.serialize()
+            for project in Project.objects.filter(pk__in=project_ids).select_related(
+                "contact"
+            )
+        }
+        projects_readonly = dict(
+            ProjectLocale.objects.filter(
+                project_id__in=project_ids, locale=locale
+            ).values_list("project_id", "readonly")
+        )
 
-        for entity in entities:
-            translation_array = []
+        nplurals = locale.nplurals or 1
+        entities_array = []
 
-            original = entity.string
-            original_plural = entity.string_plural
+        for entity in entities:
+            entity_pk = entity["pk"]
+            original = entity["string"]
+            original_plural = entity["string_plural"]
 
             if original_plural == "":
-                translation = entity.get_active_translation().serialize()
-                translation_array.append(translation)
+                translation_array = [
+                    first_active_translations.get(entity_pk, empty_translation)
+                ]
             else:
-                for plural_form in range(0, locale.nplurals or 1):
-                    translation = entity.get_active_translation(plural_form).serialize()
-                    translation_array.append(translation)
+                translation_array = [
+                    active_translations.get(
+                        (entity_pk, plural_form), empty_translation
+                    )
+                    for plural_form in range(0, nplurals)
+                ]
+
+            if preferred_source_locale != "":
+                alternatives = alternative_originals.get(entity_pk)
+                if alternatives:
+                    original = alternatives[0]
+                    if original_plural != "":
+                        original_plural = alternatives[-1]
 
-            if preferred_source_locale != "" and entity.alternative_originals:
-                original = entity.alternative_originals[0].string
-                if original_plural != "":
-                    original_plural = entity.alternative_originals[-1].string
+            # Clean the key, removing the source string and Translate
+            # Toolkit separator.
+            key = entity["key"].split(KEY_SEPARATOR)[0]
+            if key == entity["string"]:
+                key = ""
+
+            project_id = entity["resource__project_id"]
 
             entities_array.append(
                 {
-                    "pk": entity.pk,
+                    "pk": entity_pk,
                     "original": original,
                     "original_plural": original_plural,
-                    "machinery_original": entity.string,
-                    "key": entity.cleaned_key,
-                    "context": entity.context,
-                    "path": entity.resource.path,
-                    "project": entity.resource.project.serialize(),
-                    "format": entity.resource.format,
-                    "comment": entity.comment,
-                    "group_comment": entity.group_comment,
-                    "resource_comment": entity.resource_comment,
-                    "order": entity.order,
-                    "source": entity.source,
-                    "obsolete": entity.obsolete,
+                    "machinery_original": entity["string"],
+                    "key": key,
+                    "context": entity["context"],
+                    "path": entity["resource__path"],
+                    "project": projects_serialized[project_id],
+                    "format": entity["resource__format"],
+                    "comment": entity["comment"],
+                    "group_comment": entity["group_comment"],
+                    "resource_comment": entity["resource_comment"],
+                    "order": entity["order"],
+                    "source": entity["source"],
+                    "obsolete": entity["obsolete"],
                     "translation": translation_array,
-                    "readonly": entity.resource.project.projectlocale[0].readonly,
+                    "readonly": projects_readonly[project_id],
                     "is_sibling": is_sibling,
                 }
             )
@@ -3156,22 +3756,20 @@ class TranslationQuerySet(models.QuerySet):
         return translations
 
     def bulk_mark_changed(self):
-        changed_entities = {}
-        existing = ChangedEntityLocale.objects.values_list(
-            "entity", "locale"
-        ).distinct()
-
-        for translation in self.exclude(
-            entity__resource__project__data_source=Project.DataSource.DATABASE
-        ):
-            key = (translation.entity.pk, translation.locale.pk)
-
-            if key not in existing:
-                changed_entities[key] = ChangedEntityLocale(
-                    entity=translation.entity, locale=translation.locale
-                )
+        # values_list avoids instantiating translations and dereferencing
+        # their entity/locale foreign keys row by row, and ignore_conflicts
+        # delegates the duplicate check to the (entity, locale) unique
+        # constraint instead of reading the existing pairs up front.
+        changed_entities = [
+            ChangedEntityLocale(entity_id=entity_id, locale_id=locale_id)
+            for entity_id, locale_id in self.exclude(
+                entity__resource__project__data_source=Project.DataSource.DATABASE
+            )
+            .values_list("entity_id", "locale_id")
+            .distinct()
+        ]
 
-        ChangedEntityLocale.objects.bulk_create(changed_entities.values())
+        ChangedEntityLocale.objects.bulk_create(changed_entities, ignore_conflicts=True)
 
 
 class Translation(DirtyFieldsMixin, models.Model):
@@ -3288,11 +3886,12 @@ class Translation(DirtyFieldsMixin, models.Model):
 
         return translations
 
-    @property
+    @cached_property
     def latest_activity(self):
         """
         Return the date and user associated with the latest activity on
-        this translation.
+        this translation. Cached, because save() reads it repeatedly;
+        methods changing review state drop the cache before saving.
         """
         if self.approved_date is not None and self.approved_date > self.date:
             return {
@@ -3309,7 +3908,7 @@ class Translation(DirtyFieldsMixin, models.Model):
                 "type": "submitted",
             }
 
-    @property
+    @cached_property
     def machinery_sources_values(self):
         """
         Returns the corresponding comma-separated machinery_sources values
@@ -3319,7 +3918,7 @@ class Translation(DirtyFieldsMixin, models.Model):
         ]
         return ", ".join(result)
 
-    @property
+    @cached_property
     def tm_source(self):
         source = self.entity.string
 
@@ -3328,7 +3927,7 @@ class Translation(DirtyFieldsMixin, models.Model):
 
         return source
 
-    @property
+    @cached_property
     def tm_target(self):
         target = self.string
 
@@ -3341,6 +3940,17 @@ class Translation(DirtyFieldsMixin, models.Model):
         return self.string
 
     def save(self, update_stats=True, failed_checks=None, *args, **kwargs):
+        # Stats only depend on the review-state flags and on failed checks,
+        # so edits that change neither (e.g. fixing a string) can skip the
+        # two stats queries and the no-op adjust. New translations always
+        # affect the unreviewed count.
+        if update_stats and self.pk is not None and failed_checks is None:
+            dirty_fields = self.get_dirty_fields()
+            if not {"approved", "pretranslated", "fuzzy", "rejected"} & set(
+                dirty_fields
+            ):
+                update_stats = False
+
         # We parametrize update of stats to make testing easier.
         if update_stats:
             stats_before = self.entity.get_stats(self.locale)
@@ -3359,18 +3969,26 @@ class Translation(DirtyFieldsMixin, models.Model):
                 rejected=False,
             ).exclude(pk=self.pk)
 
-            # Log that all those translations are rejected.
-            for t in approved_translations:
-                log_action(
-                    ActionLog.ActionType.TRANSLATION_REJECTED,
-                    self.approved_user or self.user,
-                    translation=t,
+            # Log that all those translations are rejected. Batching the
+            # INSERTs is safe here as the rows all have the fixed, valid
+            # shape that ActionLog.save() validates.
+            performed_by = self.approved_user or self.user
+            approved_translation_pks = list(
+                approved_translations.values_list("pk", flat=True)
+            )
+            ActionLog.objects.bulk_create(
+                ActionLog(
+                    action_type=ActionLog.ActionType.TRANSLATION_REJECTED,
+                    performed_by=performed_by,
+                    translation_id=pk,
                 )
+                for pk in approved_translation_pks
+            )
 
             # Remove any TM entries of old translations that will get rejected.
             # Must be executed before translations set changes.
             TranslationMemoryEntry.objects.filter(
-                translation__in=approved_translations
+                translation_id__in=approved_translation_pks
             ).delete()
 
             approved_translations.update(
@@ -3440,16 +4058,21 @@ class Translation(DirtyFieldsMixin, models.Model):
         if not project.system_project:
             to_update.append((Locale, Q(pk=locale.pk)))
 
-        for model, query in to_update:
-            model.objects.filter(
-                Q(
-                    query
-                    & Q(
-                        Q(latest_translation=None)
-                        | Q(latest_translation__date__lt=self.latest_activity["date"])
+        # Compute the activity date once and group the UPDATEs in a single
+        # transaction, so a save issues one commit instead of up to four.
+        latest_activity_date = self.latest_activity["date"]
+
+        with transaction.atomic():
+            for model, query in to_update:
+                model.objects.filter(
+                    Q(
+                        query
+                        & Q(
+                            Q(latest_translation=None)
+                            | Q(latest_translation__date__lt=latest_activity_date)
+                        )
                     )
-                )
-            ).update(latest_translation=self)
+                ).update(latest_translation=self)
 
     def approve(self, user):
         """
@@ -3469,6 +4092,7 @@ class Translation(DirtyFieldsMixin, models.Model):
         self.rejected_user = None
         self.rejected_date = None
 
+        self.__dict__.pop("latest_activity", None)
         self.save()
 
         if not self.memory_entries.exists():
@@ -3490,6 +4114,8 @@ class Translation(DirtyFieldsMixin, models.Model):
         self.approved = False
         self.unapproved_user = user
         self.unapproved_date = timezone.now()
+
+        self.__dict__.pop("latest_activity", None)
         self.save()
 
         TranslationMemoryEntry.objects.filter(translation=self).delete()
@@ -3513,6 +4139,8 @@ class Translation(DirtyFieldsMixin, models.Model):
         self.approved_date = None
         self.pretranslated = False
         self.fuzzy = False
+
+        self.__dict__.pop("latest_activity", None)
         self.save()
 
     def unreject(self, user):
@@ -3522,6 +4150,8 @@ class Translation(DirtyFieldsMixin, models.Model):
         self.rejected = False
         self.unrejected_user = user
         self.unrejected_date = timezone.now()
+
+        self.__dict__.pop("latest_activity", None)
         self.save()
 
     def serialize(self):
@@ -3549,6 +4179,12 @@ class Translation(DirtyFieldsMixin, models.Model):
         )
 
 
+# Static parts of the TM quality expressions, built once instead of on
+# every lookup. Annotating clones them, so sharing is safe.
+TM_SOURCE_LENGTH = Length(F("source"))
+TM_SOURCE_PREFIX = Substr(F("source"), 1, 255)
+
+
 class TranslationMemoryEntryQuerySet(models.QuerySet):
     def postgres_levenshtein_ratio(
         self, text, min_quality, min_dist, max_dist, levenshtein_param=None
@@ -3568,34 +4204,55 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
         """
         text_length = Value(len(text))
 
-        source_target_length = Length(F("source")) + text_length
+        source_target_length = TM_SOURCE_LENGTH + text_length
+
+        # Rows whose distance exceeds this bound cannot reach min_quality,
+        # because the length pre-filter caps the combined length of the
+        # compared strings at (max_dist + len(text)). Passing the bound to
+        # levenshtein_less_equal() lets Postgres abort the distance
+        # calculation early for clearly dissimilar strings.
+        max_distance = int((1 - min_quality) * (max_dist + len(text))) + 1
 
         levenshtein_param = levenshtein_param or F("source")
-        levenshtein_distance_expression = LevenshteinDistance(
+        levenshtein_distance_expression = LevenshteinDistanceLessEqual(
             levenshtein_param,
             Value(text),
             1,
             2,
             2,
+            max_distance,
         )
 
-        entries = self.annotate(
-            source_length=Length(F("source")),
-            quality=ExpressionWrapper(
-                (
-                    Cast(
-                        (source_target_length - levenshtein_distance_expression),
-                        models.FloatField(),
+        entries = (
+            self.annotate(
+                source_length=TM_SOURCE_LENGTH,
+                levenshtein_distance=levenshtein_distance_expression,
+            )
+            .filter(
+                source_length__gte=min_dist,
+                source_length__lte=max_dist,
+                # The quality threshold inverted algebraically into an
+                # integer distance comparison, so the filter avoids the
+                # per-row float division:
+                # (L - lev) / L > q  <=>  lev < (1 - q) * L
+                levenshtein_distance__lt=ExpressionWrapper(
+                    (1 - min_quality) * source_target_length,
+                    output_field=models.FloatField(),
+                ),
+            )
+            .annotate(
+                quality=ExpressionWrapper(
+                    (
+                        Cast(
+                            (source_target_length - F("levenshtein_distance")),
+                            models.FloatField(),
+                        )
+                        / source_target_length
                     )
-                    / source_target_length
-                )
-                * 100,
-                output_field=models.DecimalField(),
-            ),
-        ).filter(
-            source_length__gte=min_dist,
-            source_length__lte=max_dist,
-            quality__gt=min_quality * 100,
+                    * 100,
+                    output_field=models.DecimalField(),
+                ),
+            )
         )
         return entries
 
@@ -3630,29 +4287,53 @@ class TranslationMemoryEntryQuerySet(models.QuerySet):
             min_quality,
             min_dist,
             max_dist,
-            Substr(F("source"), 1, 255),
+            TM_SOURCE_PREFIX,
         ).values_list("pk", "source")
 
         matches_pks = []
 
         # In order to keep compatibility with `postgresql_levenshtein_ratio`,
         # entries are annotate with the quality column.
-        quality_sql_map = []
-
-        for pk, source in possible_matches:
-            quality = Levenshtein.ratio(text, source)
-
-            if quality > min_quality:
-                matches_pks.append(pk)
-                quality_sql_map.append(When(pk=pk, then=Value(quality * 100)))
-
+        match_qualities = []
+
+        pk_source_pairs = list(possible_matches)
+
+        if pk_source_pairs:
+            pks, sources = zip(*pk_source_pairs)
+
+            # Compare all candidates in one C call across worker threads.
+            # Indel.normalized_similarity computes the same ratio as
+            # Levenshtein.ratio, using a bit-parallel algorithm, and
+            # score_cutoff lets it abort early, returning 0 for entries
+            # that can no longer reach min_quality.
+            qualities = process.cdist(
+                [text],
+                sources,
+                scorer=Indel.normalized_similarity,
+                score_cutoff=min_quality,
+                workers=-1,
+            )[0]
+
+            for pk, quality in zip(pks, qualities):
+                if quality > min_quality:
+                    matches_pks.append(pk)
+                    match_qualities.append(float(quality) * 100)
+
+        # Attach the computed qualities by looking them up in a pair of
+        # parameter arrays instead of generating a CASE expression with
+        # one WHEN per match, which Postgres would have to parse linearly
+        # per row.
         entries = self.filter(pk__in=matches_pks,).annotate(
-            quality=Case(
-                *quality_sql_map,
-                **dict(
-                    default=Value(0),
-                    output_field=models.DecimalField(),
-                ),
+            quality=RawSQL(
+                """
+                (
+                    SELECT q.quality
+                    FROM unnest(%s::int[], %s::float8[]) AS q (pk, quality)
+                    WHERE q.pk = base_translationmemoryentry.id
+                )
+                """,
+                (matches_pks, match_qualities),
+                output_field=models.DecimalField(),
             )
         )
         return entries
@@ -3696,6 +4377,58 @@ class TranslationMemoryEntry(models.Model):
 
     objects = TranslationMemoryEntryQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            # postgres_levenshtein_ratio pre-filters candidates on
+            # LENGTH(source); the functional btree turns that filter into
+            # an index range scan.
+            models.Index(Length("source"), name="tm_entry_source_length_idx"),
+        ]
+
+
+def _stats_count_expressions():
+    """
+    Fresh conditional Count expressions for the per-string stats
+    calculations. Errors and warnings are probed with EXISTS semi-joins
+    instead of LEFT JOINs, which cannot multiply rows, so the counts
+    need no DISTINCT and Postgres skips the deduplication sort/hash.
+    """
+    # Import the check models locally to avoid a circular import between
+    # the base and checks apps.
+    from pontoon.checks.models import Error, Warning
+
+    has_errors = Q(Exists(Error.objects.filter(translation=OuterRef("pk"))))
+    has_warnings = Q(Exists(Warning.objects.filter(translation=OuterRef("pk"))))
+    reviewed = Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True)
+
+    return dict(
+        approved_count=Count(
+            "pk",
+            filter=Q(approved=True) & ~has_errors & ~has_warnings,
+        ),
+        pretranslated_count=Count(
+            "pk",
+            filter=Q(pretranslated=True) & ~has_errors & ~has_warnings,
+        ),
+        errors_count=Count(
+            "pk",
+            filter=reviewed & has_errors,
+        ),
+        warnings_count=Count(
+            "pk",
+            filter=reviewed & has_warnings,
+        ),
+        unreviewed_count=Count(
+            "pk",
+            filter=Q(
+                approved=False,
+                rejected=False,
+                pretranslated=False,
+                fuzzy=False,
+            ),
+        ),
+    )
+
 
 class TranslatedResourceQuerySet(models.QuerySet):
     def aggregated_stats(self):
@@ -3774,11 +4507,85 @@ class TranslatedResourceQuerySet(models.QuerySet):
             locale__translatedresources__in=self,
         ).distinct()
 
-        for translated_resource in self:
-            translated_resource.calculate_stats(save=False)
+        translated_resources = list(self)
+        resource_ids = {tr.resource_id for tr in translated_resources}
+        locale_ids = {tr.locale_id for tr in translated_resources}
+
+        # Compute the counts for all translated resources with two grouped
+        # queries — one over singular entities grouped by (resource, locale),
+        # one grouped per plural entity — instead of running the
+        # calculate_stats() queries once per translated resource.
+        translations = Translation.objects.filter(
+            entity__obsolete=False,
+            entity__resource__in=resource_ids,
+            locale__in=locale_ids,
+        )
+
+        singular_counts = {
+            (row["entity__resource"], row["locale"]): row
+            for row in translations.filter(entity__string_plural="")
+            .values("entity__resource", "locale")
+            .annotate(**_stats_count_expressions())
+        }
+
+        nplurals_map = {locale.pk: locale.nplurals or 1 for locale in locales}
+        empty_counts = {
+            "approved": 0,
+            "pretranslated": 0,
+            "errors": 0,
+            "warnings": 0,
+            "unreviewed": 0,
+        }
+
+        plural_counts = {}
+        plural_rows = (
+            translations.exclude(entity__string_plural="")
+            .values("entity", "entity__resource", "locale")
+            .annotate(**_stats_count_expressions())
+        )
+        for row in plural_rows:
+            key = (row["entity__resource"], row["locale"])
+            counts = plural_counts.setdefault(key, dict(empty_counts))
+            nplurals = nplurals_map.get(row["locale"], 1)
+
+            if row["approved_count"] == nplurals:
+                counts["approved"] += 1
+            elif row["pretranslated_count"] == nplurals:
+                counts["pretranslated"] += 1
+            else:
+                if row["errors_count"]:
+                    counts["errors"] += 1
+                elif row["warnings_count"]:
+                    counts["warnings"] += 1
+
+            counts["unreviewed"] += row["unreviewed_count"]
+
+        for translated_resource in translated_resources:
+            key = (translated_resource.resource_id, translated_resource.locale_id)
+            singular = singular_counts.get(key, {})
+            plural = plural_counts.get(key, empty_counts)
+
+            translated_resource.total_strings = (
+                translated_resource.resource.total_strings
+            )
+            translated_resource.approved_strings = (
+                singular.get("approved_count", 0) + plural["approved"]
+            )
+            translated_resource.pretranslated_strings = (
+                singular.get("pretranslated_count", 0) + plural["pretranslated"]
+            )
+            translated_resource.strings_with_errors = (
+                singular.get("errors_count", 0) + plural["errors"]
+            )
+            translated_resource.strings_with_warnings = (
+                singular.get("warnings_count", 0) + plural["warnings"]
+            )
+            translated_resource.unreviewed_strings = (
+                singular.get("unreviewed_count", 0) + plural["unreviewed"]
+            )
 
         TranslatedResource.objects.bulk_update(
-            list(self),
+            translated_resources,
             fields=[
                 "total_strings",
                 "approved_strings",
@@ -3789,14 +4596,9 @@ class TranslatedResourceQuerySet(models.QuerySet):
             ],
         )
 
-        for project in projects:
-            project.aggregate_stats()
-
-        for locale in locales:
-            locale.aggregate_stats()
-
-        for projectlocale in projectlocales:
-            projectlocale.aggregate_stats()
+        projects.aggregate_stats()
+        locales.aggregate_stats()
+        projectlocales.aggregate_stats()
 
 
 class TranslatedResource(AggregatedStats):
@@ -3861,104 +4663,40 @@ class TranslatedResource(AggregatedStats):
             locale=locale,
         )
 
-        approved = translations.filter(
-            approved=True,
-            errors__isnull=True,
-            warnings__isnull=True,
-        ).count()
+        # A single aggregate computes all five counts in one scan of the
+        # translation join.
+        counts = translations.aggregate(**_stats_count_expressions())
 
-        pretranslated = translations.filter(
-            pretranslated=True,
-            errors__isnull=True,
-            warnings__isnull=True,
-        ).count()
-
-        errors = (
-            translations.filter(
-                Q(
-                    Q(Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
-                    & Q(errors__isnull=False)
-                ),
-            )
-            .distinct()
-            .count()
-        )
+        approved = counts["approved_count"]
+        pretranslated = counts["pretranslated_count"]
+        errors = counts["errors_count"]
+        warnings = counts["warnings_count"]
+        unreviewed = counts["unreviewed_count"]
 
-        warnings = (
-            translations.filter(
-                Q(
-                    Q(Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
-                    & Q(warnings__isnull=False)
-                ),
-            )
-            .distinct()
-            .count()
-        )
-
-        unreviewed = translations.filter(
-            approved=False,
-            rejected=False,
-            pretranslated=False,
-            fuzzy=False,
-        ).count()
-
-        # Plural
+        # Plural: one query groups the counts by entity instead of firing
+        # several count queries per plural entity.
         nplurals = locale.nplurals or 1
-        for e in translated_entities.exclude(string_plural="").values_list("pk"):
-            translations = Translation.objects.filter(
-                entity_id=e,
+        plural_counts = (
+            Translation.objects.filter(
+                entity__in=translated_entities.exclude(string_plural=""),
                 locale=locale,
             )
+            .values("entity")
+            .annotate(**_stats_count_expressions())
+        )
 
-            plural_approved_count = translations.filter(
-                approved=True,
-                errors__isnull=True,
-                warnings__isnull=True,
-            ).count()
-
-            plural_pretranslated_count = translations.filter(
-                pretranslated=True,
-                errors__isnull=True,
-                warnings__isnull=True,
-            ).count()
-
-            if plural_approved_count == nplurals:
+        for plural in plural_counts:
+            if plural["approved_count"] == nplurals:
                 approved += 1
-            elif plural_pretranslated_count == nplurals:
+            elif plural["pretranslated_count"] == nplurals:
                 pretranslated += 1
             else:
-                plural_errors_count = (
-                    translations.filter(
-                        Q(
-                            Q(Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
-                            & Q(errors__isnull=False)
-                        ),
-                    )
-                    .distinct()
-                    .count()
-                )
-
-                plural_warnings_count = (
-                    translations.filter(
-                        Q(
-                            Q(Q(approved=True) | Q(pretranslated=True) | Q(fuzzy=True))
-                            & Q(warnings__isnull=False)
-                        ),
-                    )
-                    .distinct()
-                    .count()
-                )
-
-                if plural_errors_count:
+                if plural["errors_count"]:
                     errors += 1
-                elif plural_warnings_count:
+                elif plural["warnings_count"]:
                     warnings += 1
 
-            plural_unreviewed_count = translations.filter(
-                approved=False, pretranslated=False, fuzzy=False, rejected=False
-            ).count()
-            if plural_unreviewed_count:
-                unreviewed += plural_unreviewed_count
+            unreviewed += plural["unreviewed_count"]
 
         if not save:
             self.total_strings = resource.total_strings
@@ -1,9 +1,22 @@
+import logging
 import sys
 
-from celery import Task
+import requests
+
+from celery import Task, shared_task
+from requests.adapters import HTTPAdapter
+
+from django.conf import settings
 
 from pontoon.base.errors import send_exception
 
+log = logging.getLogger(__name__)
+
+# Shared session, so that repeated SYSTRAN calls reuse warm TCP/TLS
+# connections instead of paying the handshake on every request.
+systran_session = requests.Session()
+systran_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
 
 class PontoonTask(Task):
     """Common functionality for all Pontoon celery tasks."""
@@ -15,3 +28,66 @@ class PontoonTask(Task):
         # but inspect can't process their custom class.
         _, _, traceback = sys.exc_info()
         send_exception(exc, exc_info=(einfo.type, exc, traceback))
+
+
+@shared_task(bind=True)
+def update_systran_translate_profile(self, locale_pk):
+    """
+    Fetch the SYSTRAN Profile UUID for the SYSTRAN Translate code of the
+    given locale and store it on the locale.
+
+    Runs as a task, so that saving a locale doesn't block on the external
+    API call.
+    """
+    from pontoon.base.models import Locale
+
+    locale = Locale.objects.filter(pk=locale_pk).first()
+    if locale is None or not locale.systran_translate_code:
+        return
+
+    api_key = settings.SYSTRAN_TRANSLATE_API_KEY
+    server = settings.SYSTRAN_TRANSLATE_SERVER
+    profile_owner = settings.SYSTRAN_TRANSLATE_PROFILE_OWNER
+    if not (api_key or server or profile_owner):
+        return
+
+    url = f"{server}/translation/supportedLanguages"
+
+    payload = {
+        "key": api_key,
+        "source": "en",
+        "target": locale.systran_translate_code,
+    }
+
+    try:
+        r = systran_session.post(url, params=payload, timeout=(3.05, 30))
+        root = r.json()
+
+        if "error" in root:
+            log.error(
+                "Unable to retrieve SYSTRAN Profile UUID: {error}".format(error=root)
+            )
+            return
+
+        for languagePair in root["languagePairs"]:
+            for profile in languagePair["profiles"]:
+                if profile["selectors"]["owner"] == profile_owner:
+                    Locale.objects.filter(pk=locale_pk).update(
+                        systran_translate_profile=profile["id"]
+                    )
+                    return
+
+    except requests.exceptions.RequestException as e:
+        log.error(f"Unable to retrieve SYSTRAN Profile UUID: {e}")
+
+
+@shared_task(bind=True)
+def aggregate_stats_for_locales(self, locale_pks):
+    """
+    Recalculate denormalized stats of the given locales.
+
+    :arg list[int] locale_pks: list of primary keys of locales to process
+    """
+    from pontoon.base.models import Locale
+
+    Locale.objects.filter(pk__in=locale_pks).aggregate_stats()
@@ -19,6 +19,9 @@ def test_repo_checkout_path(repo_git, settings):
         *[repo_git.project.checkout_path] + urlparse(repo_git.url).path.split("/")
     )
     settings.MEDIA_ROOT = "/media/root"
+    # checkout_path is cached per instance, so drop the cache to pick up
+    # the new MEDIA_ROOT.
+    del repo_git.checkout_path
     assert repo_git.checkout_path == os.path.join(
         *[repo_git.project.checkout_path] + urlparse(repo_git.url).path.split("/")
     )
@@ -172,20 +175,24 @@ def test_repo_pull_multi_locale(project_locale_a, repo_git, locale_b):
                 locale_a.code: "/media/%s" % locale_a.code,
                 locale_b.code: "/media/%s" % locale_b.code,
             }
-            assert m_update_from_vcs.call_args_list == [
-                call(
-                    "git",
-                    "https://example.com/%s" % locale_b.code,
-                    "/media/%s" % locale_b.code,
-                    "",
-                ),
-                call(
-                    "git",
-                    "https://example.com/%s" % locale_a.code,
-                    "/media/%s" % locale_a.code,
-                    "",
-                ),
-            ]
+            # Locales are pulled in parallel, so the call order is not
+            # deterministic.
+            assert sorted(m_update_from_vcs.call_args_list) == sorted(
+                [
+                    call(
+                        "git",
+                        "https://example.com/%s" % locale_b.code,
+                        "/media/%s" % locale_b.code,
+                        "",
+                    ),
+                    call(
+                        "git",
+                        "https://example.com/%s" % locale_a.code,
+                        "/media/%s" % locale_a.code,
+                        "",
+                    ),
+                ]
+            )
 
 
 @pytest.mark.django_db
@@ -11,7 +11,7 @@ from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
 from django.core.paginator import Paginator, EmptyPage
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.http import (
     Http404,
     HttpResponse,
@@ -407,7 +407,14 @@ def get_translation_history(request):
     translations = Translation.objects.filter(
         entity=entity,
         locale=locale,
-    ).prefetch_related("comments")
+    ).prefetch_related(
+        # Order and join authors in the prefetch itself, so serializing
+        # the comments doesn't query per translation.
+        Prefetch(
+            "comments",
+            queryset=Comment.objects.select_related("author").order_by("timestamp"),
+        )
+    )
 
     if plural_form != -1:
         translations = translations.filter(plural_form=plural_form)
@@ -428,7 +435,7 @@ def get_translation_history(request):
                 "date_iso": t.date.isoformat(),
                 "approved_user": User.display_name_or_blank(t.approved_user),
                 "rejected_user": User.display_name_or_blank(t.rejected_user),
-                "comments": [c.serialize() for c in t.comments.order_by("timestamp")],
+                "comments": [c.serialize() for c in t.comments.all()],
                 "machinery_sources": t.machinery_sources_values,
             }
         )
@@ -454,6 +461,7 @@ def get_team_comments(request):
     comments = (
         Comment.objects.filter(entity=entity)
         .filter(Q(locale=locale) | Q(pinned=True))
+        .select_related("author")
         .order_by("timestamp")
     )
 
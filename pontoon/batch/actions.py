@@ -62,21 +62,22 @@ def approve_translations(form, user, translations, locale):
 
     latest_translation_pk = None
     if changed_translation_pks:
-        latest_translation_pk = translations.last().pk
+        latest_translation_pk = max(changed_translation_pks)
 
     count, translated_resources, changed_entities = utils.get_translations_info(
         translations,
         locale,
     )
 
-    # Log approving actions
+    # Log approving actions. Reuse the pk list instead of materializing
+    # the Translation objects.
     actions_to_log = [
         ActionLog(
             action_type=ActionLog.ActionType.TRANSLATION_APPROVED,
             performed_by=user,
-            translation=t,
+            translation_id=pk,
         )
-        for t in translations
+        for pk in changed_translation_pks
     ]
     ActionLog.objects.bulk_create(actions_to_log)
 
@@ -19,6 +19,38 @@ class LevenshteinDistance(Func):
         super().__init__(expr1, expr2, insertion_cost, deletion_cost, substitution_cost)
 
 
+class LevenshteinDistanceLessEqual(Func):
+    """
+    Calculate the Levenshtein distance between an expression and a string,
+    with an upper bound on the distance.
+
+    Uses the accelerated `levenshtein_less_equal` variant of fuzzystrmatch,
+    which stops computing as soon as the distance is known to exceed
+    `max_distance` and only guarantees exact results up to that bound.
+    """
+
+    function = "levenshtein_less_equal"
+    arity = 6
+
+    def __init__(
+        self,
+        expr1,
+        expr2,
+        insertion_cost=1,
+        deletion_cost=2,
+        substitution_cost=2,
+        max_distance=255,
+    ):
+        super().__init__(
+            expr1,
+            expr2,
+            insertion_cost,
+            deletion_cost,
+            substitution_cost,
+            max_distance,
+        )
+
+
 class IContainsCollate(IContains):
     """
     Searching for translations may produce invalid results if you don't specify a correct
@@ -31,7 +31,7 @@ def localization(request, code, slug):
         project=project,
     )
 
-    resource_count = len(locale.parts_stats(project)) - 1
+    resource_count = len(locale.parts_stats(project, project_locale)) - 1
 
     return render(
         request,
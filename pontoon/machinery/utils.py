@@ -1,7 +1,6 @@
 import google.auth
 import google.auth.transport.requests
 import json
-import Levenshtein
 import logging
 import operator
 import os
@@ -13,6 +12,7 @@ from html import unescape
 from google.auth.exceptions import DefaultCredentialsError
 from google.cloud import translate
 from google.oauth2 import service_account
+from rapidfuzz.distance import Indel
 
 from django.conf import settings
 from django.contrib.postgres.aggregates import ArrayAgg
@@ -247,12 +247,18 @@ def get_concordance_search_data(text, locale):
             max(
                 int(
                     round(
-                        Levenshtein.ratio(text.lower(), entity["target"].lower()) * 100
+                        Indel.normalized_similarity(
+                            text.lower(), entity["target"].lower()
+                        )
+                        * 100
                     )
                 ),
                 int(
                     round(
-                        Levenshtein.ratio(text.lower(), entity["source"].lower()) * 100
+                        Indel.normalized_similarity(
+                            text.lower(), entity["source"].lower()
+                        )
+                        * 100
                     )
                 ),
             ),
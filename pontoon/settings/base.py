@@ -814,6 +814,14 @@ except ValueError:
 
 SYNC_LOG_RETENTION = 90  # days
 
+# Number of locale repositories of a multi-locale repo to pull in parallel.
+# Pulls are subprocess/network-bound, so threads spend their time waiting on
+# VCS I/O. Set to 1 to pull sequentially.
+try:
+    VCS_PULL_CONCURRENCY = int(os.environ.get("VCS_PULL_CONCURRENCY", ""))
+except ValueError:
+    VCS_PULL_CONCURRENCY = 8
+
 MANUAL_SYNC = os.environ.get("MANUAL_SYNC", "True") != "False"
 
 # Celery
@@ -319,6 +319,43 @@ class VCSProjectTests(VCSTestCase):
             ]
 
 
+class VCSProjectChangedLocalesFilesTests(VCSTestCase):
+    def setUp(self):
+        self.locale = LocaleFactory.create(code="XY")
+        self.project = ProjectFactory.create(locales=[self.locale], repositories=[])
+        self.repo = RepositoryFactory.create(
+            project=self.project,
+            url="https://example.com/l10n/{locale_code}",
+        )
+        self.other_repo = RepositoryFactory.create(
+            project=self.project,
+            url="https://example.com/other/{locale_code}",
+        )
+        super().setUp()
+
+    @patch("pontoon.sync.vcs.models.get_changed_files")
+    def test_changed_locales_files_with_repo_locales(self, get_changed_files_mock):
+        """
+        Only check repositories listed in repo_locales, if given.
+        """
+        get_changed_files_mock.return_value = (["path/to/file.ftl"], [])
+
+        vcs_project = VCSProject(
+            self.project,
+            repo_locales={self.repo.pk: [self.locale]},
+        )
+
+        assert vcs_project.changed_locales_files == {
+            "path/to/file.ftl": [self.locale],
+        }
+
+        # Only the repository from repo_locales is checked for changes.
+        assert get_changed_files_mock.call_count == 1
+        assert get_changed_files_mock.call_args[0][1] == self.repo.locale_checkout_path(
+            self.locale
+        )
+
+
 class VCSConfigurationTests(VCSTestCase):
     toml = "l10n.toml"
 
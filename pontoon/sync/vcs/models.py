@@ -224,7 +224,7 @@ class VCSProject:
         # VCS changes
         repos = self.db_project.translation_repositories()
         if self.repo_locales:
-            repos = repos.filter(pk__in=self.repo_locales.keys())
+            repos = [repo for repo in repos if repo.pk in self.repo_locales]
 
         for repo in repos:
             if repo.multi_locale: